@@ -10,18 +10,31 @@ failed authentication attempts.
 """
 
 from datetime import datetime, timedelta, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, ScalarSelect, func, insert, literal, select
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from typing import Optional, Tuple
 
-from app.models import LoginAttempt
+from app.models import LoginAttempt, User
+
+
+# Default brute-force policy: 5 failures within a 15-minute window
+MAX_FAILURES: int = 5
+WINDOW_MINUTES: int = 15
 
 
 # ----------------------------------------------------------------------
 # Record Login Attempt
 # ----------------------------------------------------------------------
-def record_login_attempts(db: Session, email: str, ip: str, success: bool) -> None:
+def record_login_attempts(db: Session, email: str, ip: str, success: bool, commit: bool = True) -> None:
     """
     Records a login attempt in the database.
 
+    Uses a Core INSERT instead of the ORM unit of work: no LoginAttempt instance
+    is created or tracked by the session. The write must be committed before
+    the request ends, since the brute-force counters must see every failure on
+    the next attempt; callers pass `commit=False` only when a later write in
+    the same request commits it.
+
     :param db: Active SQLAlchemy session.
     :type db: Session
 
@@ -34,91 +47,123 @@ def record_login_attempts(db: Session, email: str, ip: str, success: bool) -> No
     :param success: Whether the login attempt was successful.
     :type success: bool
 
+    :param commit: Whether to commit the transaction immediately.
+    :type commit: bool
+
     :return: None
     """
 
-    db.add(LoginAttempt(email=email, ip=ip, success=success))
-    db.commit()
+    db.execute(
+        insert(LoginAttempt).values(
+            email=email,
+            ip=ip,
+            success=success,
+            created_at=datetime.now(timezone.utc)
+        )
+    )
+
+    if commit:
+        db.commit()
 
 
 # ----------------------------------------------------------------------
-# Too Many Failures by IP
+# Recent Failures
 # ----------------------------------------------------------------------
-def too_many_failures_ip(db: Session, ip: str, max_failures: int = 5, minutes: int = 15) -> bool:
+def _recent_failures(column: InstrumentedAttribute, value: str, since: datetime) -> ScalarSelect:
     """
-    Checks if an IP address has exceeded the allowed number of failed login attempts
-    within a time window.
+    Builds a scalar subquery counting failed login attempts matching a column
+    value since a given instant. This is the single definition of what counts
+    as a failure towards the brute-force limit.
 
-    :param db: Active SQLAlchemy session.
-    :type db: Session
-
-    :param ip: IP address to check.
-    :type ip: str
+    :param column: LoginAttempt column to match (ip or email).
+    :type column: InstrumentedAttribute
 
-    :param max_failures:  Maximum allowed failed attempts. Defaults to 5.
-    :type max_failures: int
+    :param value: Value the column must equal.
+    :type value: str
 
-    :param minutes: Time window (in minutes) to count attempts. Defaults to 15.
-    :type minutes: int
+    :param since: Start of the counting window (UTC).
+    :type since: datetime
 
-    :return: (bool):  True if the number of failed attempts is equal to or exceeds max_failures.
-    :rtype: bool
+    :return: Scalar subquery yielding the number of failures.
+    :rtype: ScalarSelect
     """
 
-    limit_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
-
-    failures = (
-        db.query(LoginAttempt)
-        .filter(
-            LoginAttempt.ip == ip,
+    return (
+        select(func.count(LoginAttempt.id))
+        .where(
+            column == value,
             LoginAttempt.success == False,      # noqa: E712 - intentional comparison
-            LoginAttempt.created_at >= limit_time,
+            LoginAttempt.created_at >= since,
         )
-        .count()
+        .scalar_subquery()
     )
 
-    return failures >= max_failures
-
 
 # ----------------------------------------------------------------------
-# Too Many Failures by Email
+# Login State (user + failure counters in one query)
 # ----------------------------------------------------------------------
-def too_many_failures_email(db: Session, email: str, max_failures: int = 5, minutes: int = 15) -> bool:
+def load_login_state(
+    db: Session,
+    email: str,
+    ip: str,
+    minutes: int = WINDOW_MINUTES
+) -> Tuple[Optional[Row], int, int]:
     """
-    Checks whether an email address has exceeded the allowed number of failed login
-    attempts within a defined time window.
+    Loads everything the login flow needs in a single database round-trip:
+    the user matching the email and the recent failure counts for the IP and email.
+
+    The user is outer-joined onto a one-row anchor, so the counters are returned
+    even when no account exists for the given email. Only the columns login
+    reads are selected, returned as a plain row: no ORM instance is built or
+    tracked by the session.
 
     :param db: Active SQLAlchemy session.
     :type db: Session
 
-    :param email: Email to check.
+    :param email: Normalized email used in the login attempt.
     :type email: str
 
-    :param max_failures: Maximum allowed failed attempts. Defaults to 5.
-    :type max_failures: int
+    :param ip: IP address of the client.
+    :type ip: str
 
-    :param minutes: Time window (in minutes) to count attempts. Defaults to 15.
+    :param minutes: Time window (in minutes) to count failed attempts. Defaults to 15.
     :type minutes: int
 
-    :return: True if the number of failed attempts is equal to or exceeds max_failures.
-    :rtype: bool
+    :return: Tuple of (user row with id, hashed_password, role and is_verified,
+             or None; failures from this IP; failures for this email).
+    :rtype: tuple[Row | None, int, int]
     """
 
     limit_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
 
-    failures = db.query(LoginAttempt).filter(
-        LoginAttempt.email == email,
-        LoginAttempt.success == False,      # noqa: E712 - intentional comparison
-        LoginAttempt.created_at >= limit_time,
-    ).count()
+    ip_failures = _recent_failures(LoginAttempt.ip, ip, limit_time)
+    email_failures = _recent_failures(LoginAttempt.email, email, limit_time)
+
+    anchor = select(literal(1).label("anchor")).subquery()
 
-    return failures >= max_failures
+    stmt = (
+        select(
+            User.id,
+            User.hashed_password,
+            User.role,
+            User.is_verified,
+            ip_failures.label("ip_failures"),
+            email_failures.label("email_failures")
+        )
+        .select_from(anchor)
+        .outerjoin(User, User.email == email)
+    )
+
+    row = db.execute(stmt).one()
+    user = row if row.id is not None else None
+
+    return user, row.ip_failures, row.email_failures
 
 
 # ----------------------------------------------------------------------
 # Clear Failures After Successful Login
 # ----------------------------------------------------------------------
-def clear_failures(db: Session, email: str, ip: str) -> None:
+def clear_failures(db: Session, email: str, ip: str, commit: bool = True) -> None:
     """
     Clears stored failed login attempts associated with a given email or IP.
     This is typically called after a successful authentication.
@@ -132,10 +177,15 @@ def clear_failures(db: Session, email: str, ip: str) -> None:
     :param ip: Client IP address.
     :type ip: str
 
+    :param commit: Whether to commit the transaction immediately.
+    :type commit: bool
+
     :return: None
     """
 
     db.query(LoginAttempt).filter(
         (LoginAttempt.email == email) | (LoginAttempt.ip == ip),
     ).delete()
-    db.commit()
+
+    if commit:
+        db.commit()
@@ -0,0 +1,227 @@
+# app/core/cache.py
+
+"""
+In-process caching utilities.
+
+This module provides a small, thread-safe TTL cache used to short-circuit
+repeated database lookups on hot paths (e.g., refresh token validation).
+
+Entries expire after a fixed time-to-live and the cache is bounded in size:
+when full, the oldest entry is evicted first. Cached values are plain data
+(tuples, primitives), never ORM instances bound to a session.
+
+Every `clear()` or `pop()` starts a new generation. A reader that captures
+`generation` before loading a value and stores it with `set_if_generation()`
+cannot put back data loaded before a concurrent write invalidated the cache.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded, thread-safe cache whose entries expire after `ttl` seconds.
+
+    :param maxsize: Maximum number of entries kept in memory.
+    :type maxsize: int
+
+    :param ttl: Time-to-live of each entry, in seconds.
+    :type ttl: float
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Number of times the cache has been cleared or had an entry popped.
+
+        :return: The current generation.
+        :rtype: int
+        """
+
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for `key`, or `default` if missing or expired.
+
+        :param key: Cache key.
+        :type key: Hashable
+
+        :param default: Value returned on a cache miss.
+        :type default: Any
+
+        :return: The cached value or `default`.
+        :rtype: Any
+        """
+
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is None:
+                return default
+
+            expires_at, value = item
+
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store `value` under `key`, evicting the oldest entry if the cache is full.
+
+        :param key: Cache key.
+        :type key: Hashable
+
+        :param value: Value to cache.
+        :type value: Any
+
+        :return: None
+        """
+
+        with self._lock:
+            self._data.pop(key, None)
+
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def set_if_generation(self, key: Hashable, value: Any, generation: int) -> bool:
+        """
+        Store `value` under `key` only if the cache was not invalidated since `generation`.
+
+        Callers read `generation` before loading the value from its source;
+        if a write cleared the cache or popped an entry meanwhile, the value
+        may predate that write and is dropped instead of cached.
+
+        :param key: Cache key.
+        :type key: Hashable
+
+        :param value: Value to cache.
+        :type value: Any
+
+        :param generation: Generation captured before the value was loaded.
+        :type generation: int
+
+        :return: True if the value was stored, False if the cache was invalidated since.
+        :rtype: bool
+        """
+
+        with self._lock:
+            if generation != self._generation:
+                return False
+
+            self._data.pop(key, None)
+
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+            return True
+
+    def add(self, key: Hashable, value: Any) -> bool:
+        """
+        Store `value` under `key` only if no live entry exists for it.
+
+        The check and the write happen under one lock, so among concurrent
+        callers for the same key exactly one succeeds.
+
+        :param key: Cache key.
+        :type key: Hashable
+
+        :param value: Value to cache.
+        :type value: Any
+
+        :return: True if the value was stored, False if the key was already cached.
+        :rtype: bool
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is not None and item[0] >= now:
+                return False
+
+            self._data.pop(key, None)
+
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+
+            self._data[key] = (now + self.ttl, value)
+
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove `key` from the cache and return its value, starting a new generation.
+
+        :param key: Cache key.
+        :type key: Hashable
+
+        :param default: Value returned if the key is not cached.
+        :type default: Any
+
+        :return: The removed value or `default`.
+        :rtype: Any
+        """
+
+        with self._lock:
+            item = self._data.pop(key, None)
+            self._generation += 1
+
+        return default if item is None else item[1]
+
+    def get_or_set(self, key: Hashable, fetch: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """
+        Return the cached value for `key`, calling `fetch` on a miss.
+
+        `None` results are not cached, so lookups for unknown keys always
+        reach the underlying source. The fetched value is only stored if the
+        cache was not invalidated while `fetch` ran.
+
+        :param key: Cache key.
+        :type key: Hashable
+
+        :param fetch: Zero-argument callable producing the value on a miss.
+        :type fetch: Callable[[], Any | None]
+
+        :return: The cached or freshly fetched value.
+        :rtype: Any | None
+        """
+
+        value = self.get(key)
+
+        if value is None:
+            generation = self._generation
+            value = fetch()
+
+            if value is not None:
+                self.set_if_generation(key, value, generation)
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache and start a new generation.
+
+        :return: None
+        """
+
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
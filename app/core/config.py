@@ -39,6 +39,10 @@ class Settings(BaseSettings):
     ALGORITHM : str
         Cryptographic algorithm used to generate JWT tokens.
 
+    BCRYPT_ROUNDS : int
+        bcrypt cost factor (log2 of the key-expansion rounds) for new
+        password hashes.
+
     ACCESS_TOKEN_EXPIRE_MINUTES : int
         Expiration time (in minutes) for access tokens.
 
@@ -48,6 +52,15 @@ class Settings(BaseSettings):
     DATABASE_URL : str
         SQLAlchemy database connection URL.
 
+    DB_POOL_SIZE : int
+        Number of persistent connections kept in the SQLAlchemy pool.
+
+    DB_MAX_OVERFLOW : int
+        Extra connections the pool may open temporarily under load.
+
+    THREADPOOL_SIZE : int
+        Number of worker threads available to sync endpoints and dependencies.
+
     CORS_ORIGINS : List[str]
         List of allowed origins for CORS requests.
 
@@ -69,6 +82,8 @@ class Settings(BaseSettings):
     # ------------------------------------------------------------------
     SECRET_KEY: str
     ALGORITHM: str = 'HS256'
+    # Each +1 doubles hashing time; calibrate to ~100-250 ms on the deployed CPU
+    BCRYPT_ROUNDS: int = 12
 
     # ------------------------------------------------------------------
     # Token expiration settings
@@ -80,6 +95,14 @@ class Settings(BaseSettings):
     # Database
     # ------------------------------------------------------------------
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+
+    # ------------------------------------------------------------------
+    # Concurrency
+    # ------------------------------------------------------------------
+    # Sync endpoints run in AnyIO's worker thread pool (40 threads by default)
+    THREADPOOL_SIZE: int = 100
 
     # ------------------------------------------------------------------
     # CORS Configuration
@@ -16,12 +16,12 @@ throughout the application.
 """
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """
     Handles HTTPException raised in any route.
 
@@ -32,16 +32,16 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     :type exc: StarletteHTTPException
 
     :return: JSON response with the exception details and status code.
-    :rtype: JSONResponse
+    :rtype: ORJSONResponse
     """
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
 
 
-async def validation_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """
     Handles request validation errors (422 Unprocessable Entity).
 
@@ -52,16 +52,16 @@ async def validation_exception_handler(request: Request, exc: StarletteHTTPExcep
     :type exc: RequestValidationError
 
     :return: JSON response with validation errors.
-    :rtype: JSONResponse
+    :rtype: ORJSONResponse
     """
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": exc.errors()}
     )
 
 
-async def internal_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def internal_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handles uncaught internal server errors (500).
 
@@ -72,10 +72,10 @@ async def internal_exception_handler(request: Request, exc: Exception) -> JSONRe
     :type exc: Exception
 
     :return: JSON response with error message.
-    :rtype: JSONResponse
+    :rtype: ORJSONResponse
     """
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": str(exc)}
     )
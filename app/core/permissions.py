@@ -8,6 +8,11 @@ the authenticated user's role. These dependencies are intended to be used in
 FastAPI routes via the `Depends` system and work together with the authentication
 function `get_current_user`.
 
+The role checks never block, so they are declared `async` and awaited
+directly on the event loop instead of being dispatched to the worker thread
+pool like sync dependencies. `get_current_user` stays sync because it
+queries the database.
+
 Roles used in the system:
 - superadmin
 - admin
@@ -23,7 +28,7 @@ from app.core.security import get_current_user
 # ----------------------------------------------------------------------
 # Simple Specific Role Requirements
 # ----------------------------------------------------------------------
-def admin_required(user: User = Depends(get_current_user)):
+async def admin_required(user: User = Depends(get_current_user)) -> User:
     """
     Restricts access to users with the 'admin' or 'superadmin' roles.
 
@@ -45,7 +50,7 @@ def admin_required(user: User = Depends(get_current_user)):
     return user
 
 
-def superadmin_required(user: User = Depends(get_current_user)):
+async def superadmin_required(user: User = Depends(get_current_user)) -> User:
     """
     Restricts access exclusively to users with the 'superadmin' role.
 
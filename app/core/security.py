@@ -14,9 +14,11 @@ from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
+import time
+from jose import JWTError, jwk, jwt
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.database import get_db
 from app.models import User
@@ -25,14 +27,29 @@ from app.models import User
 # HTTP Bearer authentication scheme (expects Authorization: Bearer <token>)
 security = HTTPBearer()
 
-# Password hashing context using bcrypt (secure and recommended)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context using bcrypt (secure and recommended).
+# The cost factor is configurable so it can be calibrated per deployment;
+# existing hashes keep verifying with the cost stored in each hash.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 # JWT configuration from application settings
 SECRET_KEY: str = settings.SECRET_KEY
 ALGORITHM: str = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES: int = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# Access token key object, built once here instead of on every request
+# (jose otherwise re-parses the secret and constructs the key per encode/decode)
+_ACCESS_TOKEN_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+
+# User ids of recently verified access tokens, keyed by the raw token. Clients
+# send the same token on every request, so within the TTL the signature check
+# is skipped. Only successful verifications are cached.
+access_token_cache = TTLCache(maxsize=10_000, ttl=5)
+
 
 def hash_password(password: str) -> str:
     """
@@ -91,7 +108,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     to_encode.update({"exp": expire})
 
     # Encode the JWT token
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _ACCESS_TOKEN_KEY, algorithm=ALGORITHM)
 
     return encoded_jwt
 
@@ -102,7 +119,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 
     This function:
         - Extracts JWT from Authorization header
-        - Decodes it
+        - Decodes it (or reuses a verification from the last few seconds)
         - Validates expiration and signature
         - Loads the user from the database
 
@@ -122,21 +139,27 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         detail="Could not validate credentials",
     )
 
-    try:
-        # Decode token and validate structure/signature
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]
-                             )
-        user_id: str = payload.get("sub")
+    user_id = access_token_cache.get(token)
+
+    if user_id is None:
+        try:
+            # Decode token and validate structure/signature
+            payload = jwt.decode(token, _ACCESS_TOKEN_KEY, algorithms=[ALGORITHM])
+            user_id = payload.get("sub")
 
-        if user_id is None:
+            if user_id is None:
+                raise credentials_exception
+
+        except JWTError:
+            # Triggered if token is expired, invalid, or malformed
             raise credentials_exception
 
-    except JWTError:
-        # Triggered if token is expired, invalid, or malformed
-        raise credentials_exception
+        # Tokens about to expire are not cached, so none outlives its "exp"
+        if payload.get("exp", 0) - time.time() > access_token_cache.ttl:
+            access_token_cache.set(token, user_id)
 
-    # Query the authenticated user
-    user = db.query(User).filter(User.id == user_id).first()
+    # Primary-key lookup (served from the identity map when already loaded)
+    user = db.get(User, int(user_id))
 
     if user is None:
         raise credentials_exception
@@ -30,6 +30,7 @@ def log_security_event(
     request: Optional[Request] = None,
     user_id: Optional[int] = None,
     email: Optional[str] = None,
+    commit: bool = True,
 ) -> SecurityLog:
     """
     Create a detailed security event log and save it to the database.
@@ -58,11 +59,15 @@ def log_security_event(
                   (e.g., failed login attempts).
     :type email: Optional[str]
 
+    :param commit: Whether to commit immediately. Pass False to let a later
+                   write in the same request commit the entry with it.
+    :type commit: bool
+
     :return: The created SecurityLog database object.
     :rtype: SecurityLog
 
     . note::
-        - This function commits the database transaction immediately.
+        - By default this function commits the database transaction immediately.
         - Timestamps are stored in UTC for consistency and audit accuracy.
     """
 
@@ -86,7 +91,9 @@ def log_security_event(
 
     # Persist the log entry
     db.add(log)
-    db.commit()
-    db.refresh(log)
+
+    if commit:
+        db.commit()
+        db.refresh(log)
 
     return log
@@ -10,7 +10,7 @@ This module provides secure helper functions for managing:
 
 It follows security best practices:
 - Refresh tokens are never stored in plaintext.
-- Only SHA-256 hashes are persisted.
+- Only SHA-256 digests (raw 32 bytes) are persisted.
 - Expiration timestamps use UTC for audit consistency.
 """
 
@@ -18,7 +18,7 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
-from jose import jwt
+from jose import jwk, jwt
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -27,6 +27,11 @@ from app.models import RefreshToken
 
 REFRESH_TOKEN_EXPIRE_DAYS: int = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
+# Email verification tokens are HS256 JWTs signed with the application secret.
+# The HMAC key object is built once here instead of on every encode/decode.
+EMAIL_TOKEN_ALGORITHM: str = "HS256"
+_EMAIL_TOKEN_KEY = jwk.construct(settings.SECRET_KEY, EMAIL_TOKEN_ALGORITHM)
+
 
 def generate_refresh_token_plain() -> Dict[str, Any]:
     """
@@ -34,7 +39,7 @@ def generate_refresh_token_plain() -> Dict[str, Any]:
 
     :return: Containing:
                  - plain (str): The raw token returned to the client.
-                 - hash (str): SHA-256 hash to be stored in the database.
+                 - hash (bytes): SHA-256 digest to be stored in the database.
                  - expires_at (datetime): Token expiration timestamp (UTC).
     :rtype: Dict
 
@@ -53,21 +58,24 @@ def generate_refresh_token_plain() -> Dict[str, Any]:
     }
 
 
-def hash_token(token: str) -> str:
+def hash_token(token: str) -> bytes:
     """
     Return the SHA-256 hash of a refresh token.
 
+    The raw 32-byte digest is half the size of its hex form, which keeps the
+    token-hash indexes small and equality lookups cheap.
+
     :param token: Plaintext refresh token.
     :type token: str
 
-    :return: Hexadecimal digest.
-    :rtype: str
+    :return: Raw 32-byte digest.
+    :rtype: bytes
 
     . warning::
         Security: Using SHA-256 prevents attackers from impersonating users even if the database is compromised.
     """
 
-    return hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.sha256(token.encode()).digest()
 
 
 def make_refresh_record(db: Session, user_id: int, plain_token: str) -> RefreshToken:
@@ -90,7 +98,7 @@ def make_refresh_record(db: Session, user_id: int, plain_token: str) -> RefreshT
         The function commits the session and refreshes the instance.
     """
 
-    token_hash: str = hash_token(plain_token)
+    token_hash: bytes = hash_token(plain_token)
     now = datetime.now(timezone.utc)
     expires = now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
 
@@ -133,6 +141,26 @@ def create_email_verification_token(user_id: int) -> str:
 
     return jwt.encode(
         payload,
-        settings.SECRET_KEY,
-        algorithm="HS256"
+        _EMAIL_TOKEN_KEY,
+        algorithm=EMAIL_TOKEN_ALGORITHM
     )
+
+
+def decode_email_verification_token(token: str) -> int:
+    """
+    Validate an email verification token and return the user ID it was issued for.
+
+    :param token: Encoded JWT received from the verification link.
+    :type token: str
+
+    :return: ID of the user whose email is being verified.
+    :rtype: int
+
+    :raises JWTError: If the token signature is invalid or the token has expired.
+    :raises KeyError: If the token has no "sub" claim.
+    :raises ValueError: If the "sub" claim is not a valid user ID.
+    """
+
+    payload = jwt.decode(token, _EMAIL_TOKEN_KEY, algorithms=[EMAIL_TOKEN_ALGORITHM])
+
+    return int(payload["sub"])
@@ -9,17 +9,21 @@ This module initializes the FastAPI application, configures middleware
 The application exposes a root endpoint ("/") used primarily for health checks.
 """
 
+from anyio import to_thread
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi.middleware import SlowAPIMiddleware
-from typing import Any
+from typing import Any, AsyncIterator
 
 from app.core.config import settings
 from app.core.rate_limit import limiter
-from app.database import engine, Base
+from app.database import engine, Base, warm_pool
 from app.routers import auth, admin_users, products
+from app.services.email_client import EmailClient
 
 
 from app.core.exception_handlers import (
@@ -29,11 +33,46 @@ from app.core.exception_handlers import (
 )
 
 
+# ----------------------------------------------------------------------
+# Application Lifespan
+# ----------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Configures process-wide resources when the application starts.
+
+    Route handlers and dependencies are sync functions backed by a sync
+    SQLAlchemy session, so FastAPI runs them in AnyIO's worker thread pool.
+    Its default size of 40 threads caps request concurrency well below what
+    the database pool can serve, so it is raised to `THREADPOOL_SIZE`.
+
+    The database pool is then filled in a worker thread, so the first requests
+    do not each pay for opening a connection. On shutdown, the shared email
+    HTTP client's pooled connections are closed.
+
+    :param app: The FastAPI application instance.
+    :type app: FastAPI
+
+    :yield: None
+    """
+
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    await to_thread.run_sync(warm_pool)
+
+    yield
+
+    await EmailClient.aclose()
+
+
 # Initialize FastAPI instance
+# ORJSONResponse serializes response bodies with orjson, which is considerably
+# faster than the standard library json encoder used by JSONResponse.
 app: Any = FastAPI(
     title="Auth API",
     description="Authentication and product management service.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Register global handlers
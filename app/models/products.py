@@ -11,9 +11,13 @@ It supports:
 - Tracking creation and update timestamps
 
 Each entry represents a single product.
+
+On PostgreSQL, product names are indexed for full-text search with a GIN index
+over `to_tsvector('simple', name)`. Other dialects (e.g., SQLite in development
+and tests) skip the index and fall back to substring matching.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, func, literal_column
 from datetime import datetime, timezone
 
 from app.database import Base
@@ -58,3 +62,19 @@ class Product(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc)
     )
+
+    __table_args__ = (
+        # GIN index backing full-text search on the name (PostgreSQL only)
+        Index(
+            "ix_products_name_fts",
+            func.to_tsvector(literal_column("'simple'"), name),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# ----------------------------------------------------------------------
+# Full-Text Search (PostgreSQL)
+# ----------------------------------------------------------------------
+# Queries must use this exact expression so the planner can match the GIN index.
+PRODUCT_NAME_TSVECTOR = func.to_tsvector(literal_column("'simple'"), Product.name)
@@ -12,7 +12,7 @@ It is used to:
 Each entry represents a single stored refresh token.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Boolean, ForeignKey, DateTime, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -30,7 +30,7 @@ class RefreshToken(Base):
     :type user_id: int
 
     :param token_hash: Hashed representation of the refresh token for secure storage.
-    :type token_hash: str
+    :type token_hash: bytes
 
     :param revoked: Indicates whether the token has been revoked and is no longer valid.
     :type revoked: bool
@@ -49,7 +49,7 @@ class RefreshToken(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"),  nullable=False)
-    token_hash = Column(String, nullable=False, unique=True, index=True)
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True, index=True)
     revoked = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -13,7 +13,7 @@ It is used to:
 Each entry represents a single stored refresh token.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Boolean, ForeignKey, DateTime, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -31,7 +31,7 @@ class ResetToken(Base):
     :type user_id: int
 
     :param token_hash: Secure hash of the reset token (raw token is never stored).
-    :type token_hash: str
+    :type token_hash: bytes
 
     :param used: Indicates whether the token has already been used.
     :type used: bool
@@ -48,7 +48,7 @@ class ResetToken(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
-    token_hash = Column(String, nullable=False, unique=True, index=True)
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True, index=True)
     used = Column(Boolean, default=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
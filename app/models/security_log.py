@@ -69,4 +69,6 @@ class SecurityLog(Base):
     detail = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
 
-    user = relationship("User", lazy="joined")
+    # Loaded on access only: listing and refreshing log entries should not join
+    # users. Queries that need the user opt in with selectinload(SecurityLog.user).
+    user = relationship("User", lazy="select")
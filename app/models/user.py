@@ -24,7 +24,8 @@ class User(Base):
     :param id: Primary key of the user.
     :type id: int
 
-    :param email: User's unique email address.
+    :param email: User's unique email address, stored lowercased and stripped so
+                  case-insensitive lookups are plain equality matches on the index.
     :type email: str
 
     :param hashed_password: Encrypted user password.
@@ -5,15 +5,16 @@ Repository layer for managing password reset tokens.
 
 This module provides database operations for the ResetToken model, including:
 - Creating new reset tokens
-- Retrieving valid (non-used, non-expired) tokens
-- Marking tokens as used
+- Consuming a valid token atomically in a single statement
 
 These methods are used by the password reset workflow to ensure token
 validation, expiration enforcement, and single-use behavior.
 """
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
+from typing import Optional
 
 from app.models import ResetToken
 from app.core.tokens import hash_token
@@ -25,7 +26,7 @@ class ResetRepository:
     """
 
     @staticmethod
-    def create(db: Session, user_id: int, token_hash: str, expires_at: datetime) -> ResetToken:
+    def create(db: Session, user_id: int, token_hash: bytes, expires_at: datetime) -> ResetToken:
         """
         Creates a new password reset token record.
 
@@ -36,7 +37,7 @@ class ResetRepository:
         :type user_id: int
 
         :param token_hash: Hashed token value to be stored securely.
-        :type token_hash: str
+        :type token_hash: bytes
 
         :param expires_at: Datetime (UTC) when the token becomes invalid.
         :type expires_at: datetime
@@ -58,53 +59,35 @@ class ResetRepository:
         return rec
 
     @staticmethod
-    def get_valid(db: Session, token: str) -> ResetToken:
+    def consume(db: Session, token: str) -> Optional[int]:
         """
-        Retrieves a reset token if it is valid (unused and not expired).
+        Marks a valid reset token as used and returns its owner, in one statement.
 
-        :param db: Active database session.
-        :type db: Session
-
-        :param token: Raw reset token provided by the user.
-        :type token: str
-
-        :return: The valid ResetToken instance, or None if not found or invalid.
-        :rtype: ResetToken | None
-        """
-
-        token_hash = hash_token(token)
-        now = datetime.now(timezone.utc)
-
-        reset_token = db.query(ResetToken).filter(
-            ResetToken.token_hash == token_hash,
-            ResetToken.used == False,
-            ResetToken.expires_at >= now
-        ).first()
-
-        return reset_token
-
-    @staticmethod
-    def mark_used(db: Session, token: str) -> ResetToken:
-        """
-        Marks a reset token as used, making it unusable for future operations.
+        Validation and the single-use write are the same conditional
+        `UPDATE ... RETURNING`, so a token can never be redeemed twice, even
+        by concurrent requests. The change is not committed: the caller
+        commits it together with the password update.
 
         :param db: Active database session.
         :type db: Session
 
-        :param token: Raw reset token to be marked as used.
+        :param token: Raw reset token provided by the user.
         :type token: str
 
-        :return: The ResetToken record after being updated, or None if not found.
-        :rtype: ResetToken | None
+        :return: ID of the user the token belongs to, or None if the token is
+                 unknown, already used or expired.
+        :rtype: int | None
         """
 
-        token_hash = hash_token(token)
-        rec = db.query(ResetToken).filter(
-            ResetToken.token_hash == token_hash
-        ).first()
-
-        if rec:
-            rec.used = True
-            db.commit()
+        stmt = (
+            update(ResetToken)
+            .where(
+                ResetToken.token_hash == hash_token(token),
+                ResetToken.used == False,       # noqa: E712 - intentional comparison
+                ResetToken.expires_at >= datetime.now(timezone.utc)
+            )
+            .values(used=True)
+            .returning(ResetToken.user_id)
+        )
 
-        return rec
+        return db.execute(stmt).scalar_one_or_none()
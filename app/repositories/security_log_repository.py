@@ -13,13 +13,19 @@ These logs are used for auditing and monitoring security events such as:
 - Suspicious activity detection
 """
 
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.models import SecurityLog
 
 
+# Eager-load options applied to log listings. Empty while SecurityLogEntry
+# exposes no related data; add selectinload(SecurityLog.user) here if it does,
+# so each page loads users with one IN query instead of one query per entry.
+SECURITY_LOG_LIST_OPTIONS: List = []
+
+
 class SecurityLogRepository:
     """
     Repository responsible for CRUD operations on SecurityLog entries.
@@ -52,6 +58,9 @@ class SecurityLogRepository:
         """
         Retrieves a paginated and optionally filtered list of security logs.
 
+        The total is computed with `COUNT(*) OVER ()` in the same statement as
+        the page itself, so a single round-trip returns both.
+
         :param db: Active database session.
         :type db: Session
 
@@ -68,17 +77,28 @@ class SecurityLogRepository:
         :rtype: tuple[int, list[SecurityLog]]
         """
 
-        query = db.query(SecurityLog)
+        conditions = [
+            getattr(SecurityLog, field) == value
+            for field, value in filters.items()
+            if value
+        ]
 
-        for field, value in filters.items():
-            if value:
-                query = query.filter(getattr(SecurityLog, field) == value)
+        stmt = select(SecurityLog, func.count().over().label("total")) \
+            .where(*conditions) \
+            .options(*SECURITY_LOG_LIST_OPTIONS) \
+            .order_by(desc(SecurityLog.created_at)) \
+            .offset((page - 1) * limit) \
+            .limit(limit)
 
-        total = query.count()
+        rows = db.execute(stmt).all()
 
-        logs = query.order_by(desc(SecurityLog.created_at)) \
-            .offset((page - 1) * limit) \
-            .limit(limit) \
-            .all()
+        if rows:
+            return rows[0].total, [row.SecurityLog for row in rows]
+
+        if page == 1:
+            return 0, []
+
+        # Past the last page the window has no rows to report on
+        total = db.scalar(select(func.count()).select_from(SecurityLog).where(*conditions))
 
-        return total, logs
+        return total, []
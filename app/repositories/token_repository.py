@@ -8,24 +8,91 @@ This module centralizes database operations for the RefreshToken model, includin
 - Validating tokens by their hashed representation
 - Checking token revocation
 - Revoking tokens during logout or token rotation
+- Rotating a token (revoke + replace) in a single transaction
 
 These methods are used by the authentication and session management system.
+
+Lookups by token hash are cached for a short time in-process, so chatty clients
+repeatedly presenting the same refresh token do not hit the database every time.
+Entries are invalidated as soon as a token is revoked.
 """
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import NamedTuple, Optional
 
 from app.models import RefreshToken
+from app.core.cache import TTLCache
 from app.core.tokens import hash_token
 
 
+class RefreshTokenRecord(NamedTuple):
+    """
+    Detached, cacheable snapshot of a RefreshToken row.
+
+    :param id: Primary key of the refresh token entry.
+    :type id: int
+
+    :param user_id: ID of the user to whom the refresh token belongs.
+    :type user_id: int
+
+    :param token_hash: Hashed representation of the refresh token.
+    :type token_hash: bytes
+
+    :param expires_at: Timestamp indicating when the token expires.
+    :type expires_at: datetime
+
+    :param revoked: Indicates whether the token has been revoked.
+    :type revoked: bool
+    """
+
+    id: int
+    user_id: int
+    token_hash: bytes
+    expires_at: datetime
+    revoked: bool
+
+
+# Short TTL keeps the cache well inside the token rotation window
+_refresh_cache = TTLCache(maxsize=10_000, ttl=15)
+
+
+def _fetch_record(db: Session, token_hash: bytes) -> Optional[RefreshTokenRecord]:
+    """
+    Load a refresh token snapshot by hash, using the in-process cache when possible.
+
+    :param db: Active database session.
+    :type db: Session
+
+    :param token_hash: Hashed refresh token.
+    :type token_hash: bytes
+
+    :return: The token snapshot if found, otherwise None.
+    :rtype: RefreshTokenRecord | None
+    """
+
+    def fetch() -> Optional[RefreshTokenRecord]:
+        row = db.query(
+            RefreshToken.id,
+            RefreshToken.user_id,
+            RefreshToken.token_hash,
+            RefreshToken.expires_at,
+            RefreshToken.revoked
+        ).filter(RefreshToken.token_hash == token_hash).first()
+
+        return RefreshTokenRecord(*row) if row else None
+
+    return _refresh_cache.get_or_set(token_hash, fetch)
+
+
 class TokenRepository:
     """
     Repository responsible for operations involving RefreshToken records.
     """
 
     @staticmethod
-    def create_refresh(db: Session, user_id: int, token_hash: str, expires_at: datetime) -> RefreshToken:
+    def create_refresh(db: Session, user_id: int, token_hash: bytes, expires_at: datetime) -> RefreshToken:
         """
         Creates a new refresh token entry.
 
@@ -36,7 +103,7 @@ class TokenRepository:
         :type user_id: int
 
         :param token_hash: Hashed form of the refresh token for secure storage.
-        :type token_hash: str
+        :type token_hash: bytes
 
         :param expires_at: Expiration timestamp of the refresh token.
         :type expires_at: datetime
@@ -57,7 +124,7 @@ class TokenRepository:
         return token
 
     @staticmethod
-    def get_by_plain(db: Session, refresh_token: str) -> RefreshToken:
+    def get_by_plain(db: Session, refresh_token: str) -> RefreshTokenRecord | None:
         """
         Retrieves a stored refresh token by hashing its plain text value.
 
@@ -67,17 +134,14 @@ class TokenRepository:
         :param refresh_token: Plain text refresh token provided by the client.
         :type refresh_token: str
 
-        :return: The matching RefreshToken entry if found, otherwise None.
-        :rtype: RefreshToken | None
+        :return: The matching token snapshot if found, otherwise None.
+        :rtype: RefreshTokenRecord | None
         """
 
-        token_hash = hash_token(refresh_token)
-        token = db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).first()
-
-        return token
+        return _fetch_record(db, hash_token(refresh_token))
 
     @staticmethod
-    def find_valid(db: Session, refresh_token: str) -> RefreshToken:
+    def find_valid(db: Session, refresh_token: str) -> RefreshTokenRecord | None:
         """
         Retrieves a valid (non-revoked) refresh token by hashing the provided token.
 
@@ -87,31 +151,82 @@ class TokenRepository:
         :param refresh_token: Plain text refresh token provided by the client.
         :type refresh_token: str
 
-        :return: A valid RefreshToken entry if found, otherwise None.
-        :rtype: RefreshToken | None
+        :return: A valid token snapshot if found, otherwise None.
+        :rtype: RefreshTokenRecord | None
         """
 
-        token_hash = hash_token(refresh_token)
-        token = db.query(RefreshToken).filter(
-            RefreshToken.token_hash == token_hash,
-            RefreshToken.revoked == False
-        ).first()
+        token = _fetch_record(db, hash_token(refresh_token))
+
+        if token is None or token.revoked:
+            return None
 
         return token
 
     @staticmethod
-    def revoke(db: Session, token: RefreshToken) -> None:
+    def revoke(db: Session, token: RefreshTokenRecord) -> None:
         """
-        Marks a refresh token as revoked.
+        Marks a refresh token as revoked and evicts it from the lookup cache.
 
         :param db: Active database session.
         :type db: Session
 
-        :param token: The token instance to revoke.
-        :type token: RefreshToken
+        :param token: The token snapshot to revoke.
+        :type token: RefreshTokenRecord
 
         :return: None
         """
-        token.revoked = True
-        db.add(token)
+
+        db.query(RefreshToken).filter(RefreshToken.id == token.id).update({"revoked": True})
+        db.commit()
+        _refresh_cache.pop(token.token_hash, None)
+
+    @staticmethod
+    def rotate(db: Session, token: RefreshTokenRecord, new_hash: bytes, expires_at: datetime) -> bool:
+        """
+        Revokes a refresh token and stores its replacement in one transaction.
+
+        The revocation only matches a token that is still active, so when two
+        requests race to rotate the same token exactly one of them succeeds;
+        the loser's transaction is rolled back without issuing a new token.
+
+        :param db: Active database session.
+        :type db: Session
+
+        :param token: The token snapshot being rotated.
+        :type token: RefreshTokenRecord
+
+        :param new_hash: Hashed form of the replacement refresh token.
+        :type new_hash: bytes
+
+        :param expires_at: Expiration timestamp of the replacement token.
+        :type expires_at: datetime
+
+        :return: True if the token was rotated, False if it was already revoked.
+        :rtype: bool
+        """
+
+        revoked = db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == token.id, RefreshToken.revoked.is_(False))
+            .values(revoked=True)
+        )
+
+        if revoked.rowcount != 1:
+            db.rollback()
+            _refresh_cache.pop(token.token_hash, None)
+            return False
+
+        db.execute(
+            insert(RefreshToken).values(
+                user_id=token.user_id,
+                token_hash=new_hash,
+                expires_at=expires_at
+            )
+        )
         db.commit()
+
+        # Invalidate only once the revocation is visible, so a concurrent
+        # lookup cannot re-cache the token as still active
+        _refresh_cache.pop(token.token_hash, None)
+
+        return True
@@ -14,7 +14,7 @@ It is used by authentication, admin panels, and general user management logic.
 """
 
 from fastapi import HTTPException
-from sqlalchemy import asc
+from sqlalchemy import asc, func, select
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -58,21 +58,32 @@ class UserRepository:
         :rtype: User | None
         """
 
-        return db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
 
     @staticmethod
-    def count(db: Session) -> int:
+    def count(db: Session, limit: int | None = None) -> int:
         """
         Returns the total number of registered users.
 
+        With `limit`, counting stops after that many rows, so the cost stays
+        constant however large the table grows.
+
         :param db: Active database session.
         :type db: Session
 
-        :return: Total user count.
+        :param limit: Optional upper bound on the rows counted.
+        :type limit: int | None
+
+        :return: Total user count, capped at `limit` when given.
         :rtype: int
         """
 
-        return db.query(User).count()
+        if limit is None:
+            return db.query(User).count()
+
+        capped = select(User.id).limit(limit).subquery()
+
+        return db.scalar(select(func.count()).select_from(capped))
 
     @staticmethod
     def create_user(db: Session, email: str, hashed_password: str, role: str) -> User:
@@ -82,7 +93,7 @@ class UserRepository:
         :param db: Active database session.
         :type db: Session
 
-        :param email: User email.
+        :param email: User email. Stored lowercased and stripped.
         :type email: str
 
         :param hashed_password: Securely hashed password.
@@ -95,15 +106,14 @@ class UserRepository:
         :rtype: User
         """
 
-        user = User(email=email, hashed_password=hashed_password, role=role)
+        user = User(email=email.lower().strip(), hashed_password=hashed_password, role=role)
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         return user
 
     @staticmethod
-    def update_password(db: Session, user_id: int, hashed_password: str) -> User:
+    def update_password(db: Session, user_id: int, hashed_password: str, commit: bool = True) -> User:
         """
         Updates a user's password.
 
@@ -116,15 +126,20 @@ class UserRepository:
         :param hashed_password: New hashed password.
         :type hashed_password: str
 
+        :param commit: Whether to commit the transaction immediately.
+        :type commit: bool
+
         :return: The updated user, or None if not found.
         :rtype: User | None
         """
 
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
 
         if user:
             user.hashed_password = hashed_password
-            db.commit()
+
+            if commit:
+                db.commit()
 
         return user
 
@@ -170,7 +185,7 @@ class UserRepository:
         :return: The matching user or None.
         :rtype: User | None
         """
-        return db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
 
     @staticmethod
     def update(db: Session, user: User, data: dict) -> User:
@@ -192,10 +207,17 @@ class UserRepository:
         :rtype: User
         """
 
+        if not data:
+            # Partial update with no fields set: nothing to write
+            return user
+
         if "email" in data:
+            # Keep the stored email normalized so lookups stay plain index matches
+            data["email"] = data["email"].lower().strip()
+
             exists = db.query(User).filter(
                 User.email == data["email"],
-                User.id == user.id
+                User.id != user.id
             ).first()
 
             if exists:
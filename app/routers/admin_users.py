@@ -22,8 +22,7 @@ from sqlalchemy.orm import Session
 
 from app.core.permissions import admin_required, superadmin_required
 from app.database import get_db
-from app.schemas import Message
-from app.schemas.user_schema import UserListItem, UserDetail, UserUpdate
+from app.schemas import Message, UserListItem, UserDetail, UserUpdate
 from app.services.user_service import UserService
 
 router = APIRouter(prefix="/admin/users", tags=["Admin Users"])
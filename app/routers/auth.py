@@ -18,26 +18,23 @@ All business logic is delegated to AuthService, keeping the router focused
 on request/response responsibilities.
 """
 
-from fastapi import APIRouter, Depends, Request, Body, status, HTTPException
-from jose import jwt
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Body, status, HTTPException
+from jose import JWTError
 from pydantic import EmailStr
 from sqlalchemy.orm import Session
 
-from app.core.tokens import create_email_verification_token
+from app.core.tokens import create_email_verification_token, decode_email_verification_token
 from app.database import get_db
 from app.core.security import get_current_user
 from app.core.rate_limit import limiter
-from app.core.config import settings
 from app.models import User
 from app.repositories import UserRepository
-from app.schemas.auth_schema import LogoutRequest
-from app.schemas.token_schema import RefreshTokenRequest
 from app.services.auth_service import AuthService
 from app.services.email_service import EmailService
 
 from app.schemas import (
-    UserCreate, UserResponse, Login, Token, Message,
-    PasswordResetRequest, PasswordResetInput
+    UserCreate, UserResponse, Login, LogoutRequest, Token, RefreshTokenRequest,
+    Message, PasswordResetRequest, PasswordResetInput
 )
 
 
@@ -167,11 +164,17 @@ def logout(data: LogoutRequest, request: Request, db: Session = Depends(get_db))
 
 
 @router.post("/request-password-reset", response_model=Message)
-def request_password_reset(data: PasswordResetRequest, request: Request, db: Session = Depends(get_db)) -> Message:
+def request_password_reset(
+    data: PasswordResetRequest,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+) -> Message:
     """
     Request a password reset email.
 
     Always returns a generic success message to avoid account enumeration.
+    The email itself is delivered in a background task after the response is sent.
 
     :param data: Contains the email to send the reset link to.
     :type data: PasswordResetRequest
@@ -179,6 +182,9 @@ def request_password_reset(data: PasswordResetRequest, request: Request, db: Ses
     :param request: Incoming HTTP request.
     :type request: Request
 
+    :param background_tasks: Background task queue used to deliver the email.
+    :type background_tasks: BackgroundTasks
+
     :param db: Active database session.
     :type db: Session
 
@@ -189,7 +195,8 @@ def request_password_reset(data: PasswordResetRequest, request: Request, db: Ses
     result = AuthService.request_password_reset(
         db=db,
         email=data.email,
-        request=request
+        request=request,
+        background_tasks=background_tasks
     )
 
     return result
@@ -239,11 +246,19 @@ def me(current_user=Depends(get_current_user)) -> UserResponse:
 
 
 @router.post("/send-verification-email", response_model=Message)
-def send_email_verification(email: EmailStr = Body(...), db: Session = Depends(get_db)) -> Message:
+def send_email_verification(
+    background_tasks: BackgroundTasks,
+    email: EmailStr = Body(...),
+    db: Session = Depends(get_db)
+) -> Message:
     """
     Send a verification email to a user, if the account is not already verified.
 
-    Does not reveal if the user exists.
+    Does not reveal if the user exists. The email itself is delivered in a
+    background task after the response is sent.
+
+    :param background_tasks: Background task queue used to deliver the email.
+    :type background_tasks: BackgroundTasks
 
     :param email: Email address to verify.
     :type email: EmailStr
@@ -267,7 +282,7 @@ def send_email_verification(email: EmailStr = Body(...), db: Session = Depends(g
 
     token = create_email_verification_token(user.id)
 
-    EmailService.send_verification_email(user.email, token)
+    background_tasks.add_task(EmailService.send_verification_email, user.email, token)
 
     return {"detail": "Verification email sent"}
 
@@ -290,22 +305,17 @@ def verify_email(token: str, db: Session = Depends(get_db)) -> Message:
     """
 
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        user_id = int(payload["sub"])
-
-    except HTTPException:
-        raise
+        user_id = decode_email_verification_token(token)
 
-    except Exception as e:
+    except (JWTError, KeyError, ValueError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid or expired token: {e}")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     user.is_verified = True
     db.commit()
-    db.refresh(user)
 
     return {"detail": "Email verified successfully"}
@@ -7,42 +7,112 @@ Products Router
 This module exposes endpoints for managing products.
 
 Features:
-- Public product listing
+- Public product listing (full-text name search on PostgreSQL)
 - Product detail retrieval
 - Admin-protected product creation, update and deletion
 
 All write operations require admin or superadmin permissions.
+
+Read endpoints are served from a short-lived in-process cache, which every
+write endpoint clears after committing.
 """
 
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, literal_column, select, update
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.database import get_db
-from app.models.products import Product
-from app.schemas.product_schema import ProductCreate, ProductUpdate, ProductOut
+from app.models.products import Product, PRODUCT_NAME_TSVECTOR
+from app.schemas import ProductCreate, ProductUpdate, ProductOut, ProductPage
 from app.core.permissions import admin_required
 
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+# Cached GET responses, keyed by ("list", q, after_id, skip, limit), ("page", ...)
+# or ("item", product_id).
+# The catalog changes rarely; writes clear the whole cache after commit.
+product_cache = TTLCache(maxsize=1_000, ttl=60)
+
+# Validate and serialize a whole product list or page in one pydantic-core call.
+_PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductOut])
+_PRODUCT_PAGE_ADAPTER = TypeAdapter(ProductPage)
+
+# Columns read by the list endpoints: rows are serialized directly, without
+# building ORM instances or registering them in the identity map.
+_PRODUCT_OUT_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.description,
+    Product.price,
+    Product.stock,
+    Product.created_at,
+    Product.updated_at
+)
+
+
+def _filter_by_name(stmt, q: Optional[str], db: Session):
+    """
+    Restrict a product query to names matching `q`.
+
+    On PostgreSQL, `q` is matched with full-text search against the GIN-indexed
+    name vector; other dialects fall back to a case-insensitive substring match.
+
+    :param stmt: Select statement over products.
+    :type stmt: Select
+
+    :param q: Optional search terms matched against product names.
+    :type q: str | None
+
+    :param db: Active database session.
+    :type db: Session
+
+    :return: The filtered statement (unchanged when `q` is empty).
+    :rtype: Select
+    """
+
+    if not q:
+        return stmt
+
+    if db.get_bind().dialect.name == "postgresql":
+        return stmt.where(
+            PRODUCT_NAME_TSVECTOR.op("@@")(func.plainto_tsquery(literal_column("'simple'"), q))
+        )
+
+    return stmt.where(Product.name.ilike(f"%{q}%"))
+
 
 # LIST - everyone can access
 @router.get("/", response_model=List[ProductOut])
 def list_products(
-        q: Optional[str] = Query(None, description="search by name substring"),
-        skip: int = Query(0, ge=0),
+        q: Optional[str] = Query(None, description="search by product name"),
+        after_id: Optional[int] = Query(None, description="return products with an id greater than this cursor"),
+        skip: int = Query(0, ge=0, deprecated=True),
         limit: int = Query(20, ge=1, le=100),
         db: Session = Depends(get_db)
-) -> List[ProductOut]:
+) -> Response:
     """
     List products with optional name filtering and pagination.
 
-    :param q: Optional substring to search in product names.
+    Products are ordered by id. The preferred way to page is keyset
+    pagination: pass the id of the last product received as `after_id` to get
+    the next page. It seeks on the primary key, so every page costs the same,
+    whereas `skip` makes the database read and discard every skipped row.
+
+    The page is validated and encoded to JSON in a single `TypeAdapter` call
+    and the encoded body is what gets cached, so cache hits skip
+    serialization entirely.
+
+    :param q: Optional search terms matched against product names.
     :type q: str | None
 
-    :param skip: Number of items to skip.
+    :param after_id: Keyset cursor: id of the last product of the previous page.
+    :type after_id: int | None
+
+    :param skip: Number of items to skip (deprecated in favour of `after_id`).
     :type skip: int
 
     :param limit: Maximum number of items to return.
@@ -51,18 +121,96 @@ def list_products(
     :param db: Active database session.
     :type db: Session
 
-    :return: List of matching products.
-    :rtype: list[ProductOut]
+    :return: JSON list of matching products.
+    :rtype: Response
+    """
+
+    cache_key = ("list", q, after_id, skip, limit)
+    body = product_cache.get(cache_key)
+
+    if body is None:
+        # Captured before the query: a write clearing the cache meanwhile
+        # makes the fill below a no-op instead of caching pre-write rows
+        generation = product_cache.generation
+        stmt = _filter_by_name(select(*_PRODUCT_OUT_COLUMNS), q, db).order_by(Product.id)
+
+        if after_id is not None:
+            stmt = stmt.where(Product.id > after_id)
+
+        rows = db.execute(stmt.offset(skip).limit(limit)).all()
+
+        body = _PRODUCT_LIST_ADAPTER.dump_json(
+            _PRODUCT_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+        )
+        product_cache.set_if_generation(cache_key, body, generation)
+
+    return Response(content=body, media_type="application/json")
+
+
+# LIST (paginated envelope) - everyone can access
+@router.get("/paginated", response_model=ProductPage)
+def list_products_paginated(
+        q: Optional[str] = Query(None, description="search by product name"),
+        page: int = Query(1, ge=1),
+        limit: int = Query(20, ge=1, le=100),
+        db: Session = Depends(get_db)
+) -> Response:
+    """
+    List products as a page envelope carrying the total match count.
+
+    The total comes from `COUNT(*) OVER ()` on the page query itself, so the
+    count and the slice share one scan and one round-trip. As in
+    `list_products`, only the output columns are selected and the encoded
+    body is what gets cached.
+
+    :param q: Optional search terms matched against product names.
+    :type q: str | None
+
+    :param page: Page number, starting at 1.
+    :type page: int
+
+    :param limit: Number of products per page.
+    :type limit: int
+
+    :param db: Active database session.
+    :type db: Session
+
+    :return: JSON page of products with the total count.
+    :rtype: Response
     """
 
-    query = db.query(Product)
+    cache_key = ("page", q, page, limit)
+    body = product_cache.get(cache_key)
+
+    if body is None:
+        generation = product_cache.generation
+
+        stmt = _filter_by_name(select(*_PRODUCT_OUT_COLUMNS, func.count().over().label("total")), q, db) \
+            .order_by(Product.id) \
+            .offset((page - 1) * limit) \
+            .limit(limit)
+
+        rows = db.execute(stmt).all()
+
+        if rows:
+            total = rows[0].total
+
+        elif page == 1:
+            total = 0
 
-    if q:
-        query = query.filter(func.lower(Product.name).like(f"%{q.lower()}%"))
+        else:
+            # Past the last page the window has no rows to report on
+            total = db.scalar(_filter_by_name(select(func.count()).select_from(Product), q, db))
 
-    products = query.offset(skip).limit(limit).all()
+        body = _PRODUCT_PAGE_ADAPTER.dump_json(
+            _PRODUCT_PAGE_ADAPTER.validate_python(
+                {"total": total, "page": page, "limit": limit, "result": rows},
+                from_attributes=True
+            )
+        )
+        product_cache.set_if_generation(cache_key, body, generation)
 
-    return products
+    return Response(content=body, media_type="application/json")
 
 
 # GET - single product
@@ -70,28 +218,37 @@ def list_products(
 def get_product(
         product_id: int,
         db: Session = Depends(get_db)
-) -> ProductOut:
+) -> Response:
     """
     Retrieve a single product by its ID.
 
+    The encoded body is cached per product id, so repeated lookups skip both
+    the primary-key select and serialization until a write clears the cache.
+
     :param product_id: ID of the product.
     :type product_id: int
 
     :param db: Active database session.
     :type db: Session
 
-    :return: Product details if found.
-    :rtype: ProductOut
+    :return: JSON product details if found.
+    :rtype: Response
     """
 
-    product = db.query(Product).filter(
-        Product.id == product_id
-    ).first()
+    cache_key = ("item", product_id)
+    body = product_cache.get(cache_key)
 
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
+    if body is None:
+        generation = product_cache.generation
+        product = db.get(Product, product_id)
 
-    return product
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+
+        body = ProductOut.model_validate(product).model_dump_json()
+        product_cache.set_if_generation(cache_key, body, generation)
+
+    return Response(content=body, media_type="application/json")
 
 
 # CREATE - admin and superadmin
@@ -117,6 +274,7 @@ def create_product(
     db.add(product)
     db.commit()
     db.refresh(product)
+    product_cache.clear()
 
     return product
 
@@ -127,10 +285,13 @@ def update_product(
     product_id: int,
     product_in: ProductUpdate,
     db: Session = Depends(get_db)
-) -> Product:
+) -> ProductOut:
     """
     Update an existing product. Admin or superadmin only.
 
+    Issues a single `UPDATE ... RETURNING` statement instead of loading the
+    row first and flushing attribute changes.
+
     :param product_id: ID of the product to update.
     :type product_id: int
 
@@ -141,23 +302,32 @@ def update_product(
     :type db: Session
 
     :return: Updated product.
-    :rtype: Product
+    :rtype: ProductOut
     """
 
-    product = db.query(Product).filter(Product.id == product_id).first()
+    update_data = product_in.model_dump(exclude_unset=True)
 
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
+    if update_data:
+        stmt = (
+            update(Product)
+            .where(Product.id == product_id)
+            .values(**update_data)
+            .returning(Product)
+        )
+        product = db.scalars(stmt).one_or_none()
 
-    update_data = product_in.model_dump(exclude_unset=True)
+    else:
+        # Nothing to change: an empty SET clause is invalid, so just fetch the row
+        product = db.get(Product, product_id)
 
-    for key, value in update_data.items():
-        setattr(product, key, value)
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
 
+    result = ProductOut.model_validate(product)
     db.commit()
-    db.refresh(product)
+    product_cache.clear()
 
-    return product
+    return result
 
 
 # DELETE - superadmin only
@@ -169,6 +339,9 @@ def delete_product(
     """
     Delete a product. Superadmin only (enforced by admin_required + role system).
 
+    Issues a single `DELETE ... RETURNING` statement instead of loading the
+    row before deleting it.
+
     :param product_id: ID of the product to delete.
     :type product_id: int
 
@@ -179,17 +352,20 @@ def delete_product(
     :rtype: ProductOut
     """
 
-    product = db.query(Product).filter(Product.id == product_id).first()
+    stmt = delete(Product).where(Product.id == product_id).returning(Product)
+    product = db.scalars(stmt).one_or_none()
 
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    db.delete(product)
-    db.commit()
-
-    return {
+    result = {
         "name": product.name,
         "price": product.price,
         "stock": product.stock,
         "id": product.id
     }
+
+    db.commit()
+    product_cache.clear()
+
+    return result
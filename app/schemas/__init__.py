@@ -1,19 +1,29 @@
 # app/schemas/__init__.py
 
-from .user_schema import UserCreate, UserResponse
-from .auth_schema import Login
-from .token_schema import Token
+from .user_schema import UserCreate, UserResponse, UserListItem, UserDetail, UserUpdate
+from .auth_schema import Login, LogoutRequest
+from .token_schema import Token, RefreshTokenRequest
 from .password_reset_schema import PasswordResetRequest, PasswordResetInput
+from .product_schema import ProductCreate, ProductUpdate, ProductOut, ProductPage
 from .security_log_schema import SecurityLogEntry, SecurityLogList
 from .message_schema import Message
 
 __all__ = [
     "UserCreate",
     "UserResponse",
+    "UserListItem",
+    "UserDetail",
+    "UserUpdate",
     "Login",
+    "LogoutRequest",
     "Token",
+    "RefreshTokenRequest",
     "PasswordResetRequest",
     "PasswordResetInput",
+    "ProductCreate",
+    "ProductUpdate",
+    "ProductOut",
+    "ProductPage",
     "SecurityLogEntry",
     "SecurityLogList",
     "Message"
@@ -11,20 +11,22 @@ Includes:
 - Logout request payload
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from .user_schema import NormalizedEmail
 
 class Login(BaseModel):
     """
     Schema for user login input.
 
-    :param email: User email address.
+    :param email: User email address (normalized to lowercase).
     :type email: EmailStr
 
     :param password: User plaintext password.
     :type password: str
     """
 
-    email: EmailStr
+    email: NormalizedEmail
     password: str
 
 
@@ -7,18 +7,21 @@ Password Reset Schemas
 Schemas used for handling password reset requests and submissions.
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from .user_schema import NormalizedEmail
 
 
 class PasswordResetRequest(BaseModel):
     """
     Schema for requesting a password reset link.
 
-    :param email: Email address of the user requesting password reset.
+    :param email: Email address of the user requesting password reset
+                  (normalized to lowercase).
     :type email: EmailStr
     """
 
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class PasswordResetInput(BaseModel):
@@ -10,7 +10,7 @@ Schemas used for creating, updating, and returning product information.
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import List, Optional
 
 
 class ProductBase(BaseModel):
@@ -91,3 +91,26 @@ class ProductOut(ProductBase):
     updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProductPage(BaseModel):
+    """
+    Represents a paginated list of products.
+
+    :param total: Total number of matching products.
+    :type total: int
+
+    :param page: Current page number.
+    :type page: int
+
+    :param limit: Number of products per page.
+    :type limit: int
+
+    :param result: Products on the current page.
+    :type result: List[ProductOut]
+    """
+
+    total: int
+    page: int
+    limit: int
+    result: List[ProductOut]
@@ -13,8 +13,13 @@ Schemas for representing users in various contexts:
 These schemas are used in endpoints for admin management, registration, and profile management.
 """
 
-from pydantic import BaseModel, EmailStr, ConfigDict, Field
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, EmailStr, ConfigDict, Field
+from typing import Annotated, Optional
+
+
+# Email input normalized once at the API boundary: stripped and lowercased,
+# matching how addresses are stored, so services can use it as-is.
+NormalizedEmail = Annotated[EmailStr, AfterValidator(lambda email: email.strip().lower())]
 
 
 class UserBase(BaseModel):
@@ -72,7 +77,7 @@ class UserUpdate(BaseModel):
 
     Fields are optional to allow partial updates.
 
-    :param email: New email address.
+    :param email: New email address (normalized to lowercase).
     :type email: Optional[EmailStr]
 
     :param role: New role.
@@ -82,7 +87,7 @@ class UserUpdate(BaseModel):
     :type is_active: Optional[bool]
     """
 
-    email: Optional[EmailStr] = None
+    email: Optional[NormalizedEmail] = None
     role: Optional[str] = None
     is_active: Optional[bool] = None
 
@@ -91,7 +96,7 @@ class UserCreate(BaseModel):
     """
     Schema for creating a new user.
 
-    :param email: User's email address.
+    :param email: User's email address (normalized to lowercase).
     :type email: EmailStr
 
     :param password: User's password (minimum length 6).
@@ -101,7 +106,7 @@ class UserCreate(BaseModel):
     :type role: Optional[str]
     """
 
-    email: EmailStr
+    email: NormalizedEmail
     password: str = Field(min_length=6)
     role: Optional[str] = None
 
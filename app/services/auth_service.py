@@ -15,11 +15,13 @@ Provides core authentication operations:
 All security events are logged via `log_security_event`.
 """
 
+import secrets
 from datetime import datetime, timezone
-from fastapi import HTTPException, status, Request
+from fastapi import BackgroundTasks, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from typing import Any, Dict
 
+from app.core.cache import TTLCache
 from app.repositories import UserRepository
 from app.repositories import TokenRepository
 from app.repositories import ResetRepository
@@ -34,10 +36,22 @@ from app.core.security import (
 )
 
 from app.core.bruteforce import (
-    record_login_attempts, clear_failures, too_many_failures_ip, too_many_failures_email
+    MAX_FAILURES, record_login_attempts, clear_failures, load_login_state
 )
 
 
+# Hash of a random password nobody knows. Unknown emails are verified against it
+# so a failed login always costs one bcrypt check, whether the account exists or not.
+_DUMMY_PASSWORD_HASH: str = hash_password(secrets.token_urlsafe(32))
+
+# Emails that requested a password reset in the last minute. Repeated requests
+# inside the window get the generic response without a new token or email.
+reset_request_cache = TTLCache(maxsize=10_000, ttl=60)
+
+# The one response to every reset request, whether or not the account exists
+RESET_REQUESTED_DETAIL: str = "If the email exists, a reset link has been sent"
+
+
 class AuthService:
     """
     Service class providing authentication-related methods.
@@ -57,7 +71,7 @@ class AuthService:
         :param db: Active database session.
         :type db: Session
 
-        :param email: Email address of the new user.
+        :param email: Normalized email address of the new user.
         :type email: str
 
         :param password: Plain text password of the new user.
@@ -72,14 +86,12 @@ class AuthService:
         :raises HTTPException: If email is already registered.
         """
 
-        email = email.lower().strip()
-
         # Check existing
         if UserRepository.get_by_email(db, email):
             raise HTTPException(status.HTTP_400_BAD_REQUEST, "Email already registered")
 
-        # Assign roles based on total users
-        count = UserRepository.count(db)
+        # Assign roles based on total users; only 0, 1 or "2 or more" matters
+        count = UserRepository.count(db, limit=2)
 
         role = "superadmin" if count == 0 else ("admin" if count == 1 else "user")
 
@@ -108,7 +120,7 @@ class AuthService:
         :param db: Active database session.
         :type db: Session
 
-        :param email: User email.
+        :param email: Normalized user email.
         :type email: str
 
         :param password: User password.
@@ -126,10 +138,11 @@ class AuthService:
         :raises HTTPException: If credentials are invalid, email not verified, or brute-force limits exceeded.
         """
 
-        email = email.lower().strip()
+        # User lookup and both brute-force counters in a single round-trip
+        user, ip_failures, email_failures = load_login_state(db, email, ip)
 
         # anti-bruteforce - IP
-        if too_many_failures_ip(db, ip):
+        if ip_failures >= MAX_FAILURES:
             log_security_event(
                 db,
                 "ip_blocked",
@@ -142,7 +155,7 @@ class AuthService:
             raise HTTPException(429, "Too many attempts from this IP")
 
         # anti-bruteforce - Email
-        if too_many_failures_email(db, email):
+        if email_failures >= MAX_FAILURES:
             log_security_event(
                 db,
                 "email_blocked",
@@ -154,10 +167,14 @@ class AuthService:
 
             raise HTTPException(429, "Too many attempts for this email")
 
-        user = UserRepository.get_by_email(db, email)
+        # Always run exactly one bcrypt verification to avoid a user-enumeration timing oracle
+        target_hash = user.hashed_password if user else _DUMMY_PASSWORD_HASH
+        password_ok = verify_password(password, target_hash)
 
-        if not user or not verify_password(password, user.hashed_password):
-            record_login_attempts(db, email, ip, success=False)
+        # Each outcome below is written in a single transaction, committed by its
+        # final write, so a login pays for one commit instead of one per write.
+        if not user or not password_ok:
+            record_login_attempts(db, email, ip, success=False, commit=False)
 
             log_security_event(
                 db,
@@ -171,7 +188,7 @@ class AuthService:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
 
         if not user.is_verified:
-            record_login_attempts(db, email, ip, success=False)
+            record_login_attempts(db, email, ip, success=False, commit=False)
 
             log_security_event(
                 db,
@@ -185,8 +202,8 @@ class AuthService:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Email not verified")
 
         # Success
-        clear_failures(db, email, ip)
-        record_login_attempts(db, email, ip, success=True)
+        clear_failures(db, email, ip, commit=False)
+        record_login_attempts(db, email, ip, success=True, commit=False)
 
         log_security_event(
             db,
@@ -195,7 +212,8 @@ class AuthService:
             "Login successful",
             request,
             user_id=user.id,
-            email=email
+            email=email,
+            commit=False
         )
 
         access = create_access_token({"sub": str(user.id), "role": user.role})
@@ -234,11 +252,21 @@ class AuthService:
 
         token_data = TokenRepository.find_valid(db, refresh_token)
 
-        expires_at = token_data.expires_at
-        if expires_at.tzinfo is None:  # naive
+        expires_at = token_data.expires_at if token_data else None
+        if expires_at is not None and expires_at.tzinfo is None:  # naive
             expires_at = expires_at.replace(tzinfo=timezone.utc)
 
-        if not token_data or expires_at < datetime.now(timezone.utc):
+        rotated = False
+
+        # The replacement is only generated once the presented token checks out
+        if token_data and expires_at >= datetime.now(timezone.utc):
+            new_refresh = generate_refresh_token_plain()
+
+            # Rotate token: revoke the old one and store the new one in one transaction.
+            # Rotation fails if a concurrent request already revoked the token.
+            rotated = TokenRepository.rotate(db, token_data, new_refresh["hash"], new_refresh["expires_at"])
+
+        if not rotated:
             log_security_event(
                 db,
                 "refresh_invalid",
@@ -249,12 +277,6 @@ class AuthService:
 
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid or expired refresh token")
 
-        # Rotate token
-        TokenRepository.revoke(db, token_data)
-
-        new_refresh = generate_refresh_token_plain()
-        TokenRepository.create_refresh(db, token_data.user_id, new_refresh["hash"], new_refresh["expires_at"])
-
         access = create_access_token({"sub": str(token_data.user_id)})
 
         log_security_event(
@@ -325,34 +347,46 @@ class AuthService:
     #     REQUEST PASSWORD RESET
     # ============================
     @staticmethod
-    def request_password_reset(db: Session, email: str, request: Request) -> dict:
+    def request_password_reset(
+        db: Session,
+        email: str,
+        request: Request,
+        background_tasks: BackgroundTasks
+    ) -> dict:
         """
-        Generate password reset token and send email. Always returns success message
-        without revealing existence of the user.
+        Generate password reset token and schedule the reset email. Always returns
+        success message without revealing existence of the user.
+
+        Only the first request per email within a minute does any work; bursts
+        of retries for the same address create no extra tokens or emails.
 
         :param db: Active database session.
         :type db: Session
 
-        :param email: Email to send reset link to.
+        :param email: Normalized email to send reset link to.
         :type email: str
 
         :param request: FastAPI request object for logging.
         :type request: Request
 
+        :param background_tasks: Queue used to send the email after the response is returned.
+        :type background_tasks: BackgroundTasks
+
         :return: Confirmation message.
         :rtype: dict
         """
 
-        email = email.lower().strip()
+        if not reset_request_cache.add(email, True):
+            return {"detail": RESET_REQUESTED_DETAIL}
 
         user = UserRepository.get_by_email(db, email)
 
         if not user:
-            return {"detail": "If the email exists, a reset link will be sent"}
+            return {"detail": RESET_REQUESTED_DETAIL}
 
         token = ResetService.create_reset_token(db, user.id)
 
-        EmailService.send_password_reset(email, token)
+        background_tasks.add_task(EmailService.send_password_reset, email, token)
 
         log_security_event(
             db,
@@ -362,7 +396,7 @@ class AuthService:
             request, user_id=user.id
         )
 
-        return {"detail": "If the email exists, a reset link has been sent"}
+        return {"detail": RESET_REQUESTED_DETAIL}
 
     # ============================
     #         RESET PASSWORD
@@ -390,9 +424,16 @@ class AuthService:
         :raises HTTPException: If reset token is invalid or expired.
         """
 
-        user = ResetRepository.get_valid(db, token)
+        # Hash before touching the token row: consume() opens the write
+        # transaction, and the slow bcrypt hash must not run while it holds
+        # the lock. Hashing unconditionally also keeps invalid tokens from
+        # answering faster than valid ones.
+        new_hash = hash_password(new_password)
 
-        if not user:
+        # Validate and burn the token in one statement; committed with the new password
+        user_id = ResetRepository.consume(db, token)
+
+        if user_id is None:
             log_security_event(
                 db,
                 "reset_failed",
@@ -403,8 +444,7 @@ class AuthService:
 
             raise HTTPException(400, "Invalid or expired reset token")
 
-        UserRepository.update_password(db, user.id, hash_password(new_password))
-        ResetService.mark_used(db, token)
+        UserRepository.update_password(db, user_id, new_hash, commit=False)
 
         log_security_event(
             db,
@@ -412,7 +452,7 @@ class AuthService:
             "success",
             "Password reset successfully",
             request,
-            user_id=user.id
+            user_id=user_id
         )
 
         return {"detail": "Password updated successfully"}
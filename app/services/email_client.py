@@ -9,13 +9,69 @@ for sending transactional emails from the application.
 
 It abstracts the HTTP requests, allowing other services to send emails without
 dealing directly with the HTTP client or API details.
+
+Requests go through a single module-level `httpx.AsyncClient`, so TCP/TLS
+connections to Brevo are pooled and kept alive across emails instead of
+being re-established for every message, and sending never blocks a thread.
+The client is closed at application shutdown and transparently rebuilt if
+the application starts again in the same process.
 """
 
-import requests
+import httpx
 
 from app.core.config import settings
 
 
+BREVO_API_URL = "https://api.brevo.com"
+
+# Sender block shared by every outgoing email
+_SENDER = {
+    "name": "Auth API",
+    "email": settings.MAIL_SENDER
+}
+
+
+
+def _build_client() -> httpx.AsyncClient:
+    """
+    Build the connection-pooled HTTP client used to talk to Brevo.
+
+    :return: A new client with the Brevo base URL and API key headers set.
+    :rtype: httpx.AsyncClient
+    """
+
+    return httpx.AsyncClient(
+        base_url=BREVO_API_URL,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        headers={
+            "api-key": settings.BREVO_API_KEY,
+            "Content-Type": "application/json"
+        }
+    )
+
+
+# Shared client. Closed by the application lifespan and rebuilt on next use.
+_client = _build_client()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, rebuilding it if a previous lifespan
+    shutdown closed it.
+
+    :return: An open client.
+    :rtype: httpx.AsyncClient
+    """
+
+    global _client
+
+    if _client.is_closed:
+        _client = _build_client()
+
+    return _client
+
+
 class EmailClient:
     """
     A client class for sending emails via the Brevo API.
@@ -24,7 +80,7 @@ class EmailClient:
     """
 
     @staticmethod
-    def send_email(to_email: str, subject: str, html_content: str) -> bool:
+    async def send_email(to_email: str, subject: str, html_content: str) -> bool:
         """
         Send an email using the Brevo API.
 
@@ -40,32 +96,29 @@ class EmailClient:
         :return: True if the email was sent successfully (HTTP 201), False otherwise.
         :rtype: bool
 
-        :raises requests.RequestException: If the HTTP request fails due to network or other issues.
+        :raises httpx.HTTPError: If the HTTP request fails due to network or other issues.
         """
 
         # Construct the payload according to Brevo's API requirements
         payload = {
-            'sender': {
-                "name": "Auth API",
-                "email": settings.MAIL_SENDER,
-            },
+            "sender": _SENDER,
             "to": [{"email": to_email}],
             "subject": subject,
             "htmlContent": html_content
         }
 
-        # HTTP headers with API key authentication
-        headers = {
-            "api-key": settings.BREVO_API_KEY,
-            "Content-Type": "application/json"
-        }
-
-        # Send POST request to Brevo API endpoint
-        response = requests.post(
-            "https://api.brevo.com/v3/smtp/email",
-            json=payload,
-            headers=headers
-        )
+        # Send POST request to Brevo API endpoint (API key header set on the client)
+        response = await _get_client().post("/v3/smtp/email", json=payload)
 
         # Return True if API responded with 201 Created, else False
         return response.status_code == 201
+
+    @staticmethod
+    async def aclose() -> None:
+        """
+        Close the shared HTTP client and its pooled connections.
+
+        :return: None
+        """
+
+        await _client.aclose()
@@ -12,14 +12,34 @@ Provides high-level methods for sending transactional emails, such as:
 Uses the Brevo (formerly SendinBlue) SMTP API to send emails.
 This service wraps around EmailClient for sending emails, and can be extended
 for other email types in the future.
-"""
 
-import requests
+Sending is asynchronous: routes schedule these coroutines as background tasks,
+which run on the event loop without occupying a worker thread.
+"""
 
 from app.core.config import settings
 from app.services.email_client import EmailClient
 
 
+# Email bodies, built once at import with the frontend URL already filled in
+# and split around the token, so each send is a single concatenation.
+# rpartition splits on the placeholder itself: only constant text follows it,
+# while the interpolated URL before it may contain anything.
+_RESET_HTML_PREFIX, _, _RESET_HTML_SUFFIX = f"""
+            <h2>Password Reset</h2>
+            <p>Click the link below to reset your password:</p>
+            <a href="{settings.FRONTEND_URL}/reset-password?token={{token}}">Reset Password</a>
+            <p>This link expires in 15 minutes.</p>
+        """.rpartition("{token}")
+
+_VERIFY_HTML_PREFIX, _, _VERIFY_HTML_SUFFIX = f"""
+            <h2>Email Verification</h2>
+            <p>Click the link below to verify your email address:</p>
+            <a href="{settings.FRONTEND_URL}/verify-email?token={{token}}">Verify Email</a>
+            <p>This link expires in 15 minutes.</p>
+        """.rpartition("{token}")
+
+
 class EmailService:
     """
     Service class responsible for sending different types of emails.
@@ -28,7 +48,7 @@ class EmailService:
     """
 
     @staticmethod
-    def send_password_reset(to_email: str, token: str) -> bool:
+    async def send_password_reset(to_email: str, token: str) -> bool:
         """
         Send a password reset email to a user.
 
@@ -42,22 +62,14 @@ class EmailService:
         :rtype: bool
         """
 
-        # Construct the reset link pointing to frontend
-        url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
-
-        # HTML content of the email
-        html_content = f"""
-            <h2>Password Reset</h2>
-            <p>Click the link below to reset your password:</p>
-            <a href="{url}">Reset Password</a>
-            <p>This link expires in 15 minutes.</p>
-        """
+        # HTML content of the email, with the reset link pointing to frontend
+        html_content = _RESET_HTML_PREFIX + token + _RESET_HTML_SUFFIX
 
         # Send the email using the EmailClient
-        return EmailClient.send_email(to_email, "Password Reset Request", html_content)
+        return await EmailClient.send_email(to_email, "Password Reset Request", html_content)
 
     @staticmethod
-    def send_verification_email(to_email: str, token: str) -> bool:
+    async def send_verification_email(to_email: str, token: str) -> bool:
         """
         Send an email verification message to a user.
 
@@ -71,39 +83,8 @@ class EmailService:
         :rtype: bool
         """
 
-        # Construct the verification link pointing to frontend
-        url = f"{settings.FRONTEND_URL}/verify-email?token={token}"
-
-        # Prepare the payload for Brevo API
-        payload = {
-            "sender": {
-                "name": "Auth API",
-                "email": settings.MAIL_SENDER
-            },
-            "to": [
-                {"email": to_email}
-            ],
-            "subject": "Verify Your Email Address",
-            "htmlContent": f"""
-                <h2>Email Verification</h2>
-                <p>Click the link below to verify your email address:</p>
-                <a href="{url}">Verify Email</a>
-                <p>This link expires in 15 minutes.</p>
-            """
-        }
-
-        # HTTP headers with API key
-        headers = {
-            "api-key": settings.BREVO_API_KEY,
-            "Content-Type": "application/json"
-        }
-
-        # Send POST request to Brevo API
-        response = requests.post(
-            "https://api.brevo.com/v3/smtp/email",
-            json=payload,
-            headers=headers
-        )
-
-        # Return True if API responded with 201 Created
-        return response.status_code == 201
+        # HTML content of the email, with the verification link pointing to frontend
+        html_content = _VERIFY_HTML_PREFIX + token + _VERIFY_HTML_SUFFIX
+
+        # Send the email using the EmailClient's pooled connection
+        return await EmailClient.send_email(to_email, "Verify Your Email Address", html_content)
@@ -4,8 +4,8 @@
 Reset Service
 -------------
 
-Provides functionality for password reset tokens, including creation, validation,
-and marking tokens as used. Tokens are time-limited and securely hashed for storage.
+Provides functionality for creating password reset tokens. Tokens are time-limited
+and securely hashed for storage.
 """
 
 import secrets
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 
 from app.models import ResetToken
-from app.repositories import ResetRepository, UserRepository
+from app.repositories import ResetRepository
 from app.core.tokens import hash_token
 
 
@@ -22,7 +22,7 @@ RESET_EXPIRE_MINUTES: int = 15
 
 class ResetService:
     """
-    Service responsible for creating, verifying, and marking password reset tokens.
+    Service responsible for creating password reset tokens.
     """
 
     @staticmethod
@@ -48,42 +48,3 @@ class ResetService:
         ResetRepository.create(db, user_id, token_hash, expires)
 
         return plain
-
-    @staticmethod
-    def verify_reset_token(db: Session, token: str) -> UserRepository | None:
-        """
-        Verifies if a reset token is valid and returns the associated user.
-
-        :param db: Active database session.
-        :type db: Session
-
-        :param token: Plain text reset token.
-        :type token: str
-
-        :return: User object if token is valid, None otherwise.
-        :rtype: UserRepository | None
-        """
-
-        record = ResetRepository.get_valid(db, token)
-
-        if not record:
-            return None
-
-        return UserRepository.get_by_id(db, record.user_id)
-
-    @staticmethod
-    def mark_used(db: Session, token: str) -> bool:
-        """
-        Marks a reset token as used to prevent reuse.
-
-        :param db: Active database session.
-        :type db: Session
-
-        :param token: Plain text reset token.
-        :type token: str
-
-        :return: True if token was successfully marked as used, False otherwise.
-        :rtype: bool
-        """
-
-        return ResetRepository.mark_used(db, token)
@@ -13,17 +13,31 @@ for the FastAPI app. It provides:
 - Rate limiter disabled for testing
 """
 
+import os
+import itertools
 import pytest
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
-from typing import Callable
-
-from app.main import app, limiter
-from app.database import Base, get_db
-from app.models import User, Product
-from app.core.security import hash_password
+from typing import Callable, Generator
+
+# Tests exercise the auth flow, not bcrypt's work factor: use the minimum
+# cost (must be set before the app reads its settings)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from app.main import app, limiter                               # noqa: E402
+from app.routers.products import product_cache                  # noqa: E402
+from app.services.auth_service import reset_request_cache       # noqa: E402
+from app.repositories.token_repository import _refresh_cache    # noqa: E402
+from app.database import Base, get_db                           # noqa: E402
+from app.models import User, Product, RefreshToken              # noqa: E402
+from app.core.security import (                                 # noqa: E402
+    access_token_cache, create_access_token, hash_password
+)
+from app.core.tokens import hash_token                          # noqa: E402
 
 
 # --------------------------
@@ -35,24 +49,79 @@ engine_test = create_engine(
     poolclass=StaticPool
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine_test)
+# Like the application's SessionLocal, instances are not expired on commit
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine_test
+)
+
+# Sequence numbers for generated emails: unique within the session and
+# reproducible from one run to the next
+_email_counter = itertools.count(1)
+
+
+# --------------------------
+# Password hashes shared across factories
+# --------------------------
+@lru_cache(maxsize=None)
+def hashed(password: str) -> str:
+    """
+    Returns a bcrypt hash of `password`, computed once per distinct password.
+
+    Factories create many users with the same password ("123456"), so the
+    deliberately slow hash is paid once per session rather than per user.
+
+    :param password: Plaintext password.
+    :type password: str
+
+    :return: bcrypt hash of the password.
+    :rtype: str
+    """
+
+    return hash_password(password)
+
+
+# --------------------------
+# Schema created once per test session
+# --------------------------
+@pytest.fixture(autouse=True, scope="session")
+def create_schema() -> None:
+    """
+    Creates every table in the in-memory database once for the whole session.
+
+    :return: None
+    """
+
+    Base.metadata.create_all(bind=engine_test)
+    yield
 
 
 # --------------------------
 # Fixture to reset DB before each test
 # --------------------------
 @pytest.fixture(autouse=True)
-def reset_db() -> None:
+def reset_db(create_schema: None) -> None:
     """
-    Resets the in-memory database before each test.
+    Empties the in-memory database and response caches before each test.
 
     Ensures that each test runs in a clean environment and is not affected
-    by previous tests.
+    by previous tests. Rows are deleted in a single transaction (children
+    before parents) instead of dropping and recreating the schema, so no DDL
+    runs per test.
 
     :return: None
     """
-    Base.metadata.drop_all(bind=engine_test)
-    Base.metadata.create_all(bind=engine_test)
+
+    with engine_test.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+    product_cache.clear()
+    reset_request_cache.clear()
+    access_token_cache.clear()
+    _refresh_cache.clear()
     yield
 
 # --------------------------
@@ -63,6 +132,10 @@ def db_session() -> Session:
     """
     Provides a SQLAlchemy session for tests.
 
+    Objects are not expired on commit (see TestingSessionLocal): factories
+    return them with the values they were created with (ids are filled in by
+    the INSERT), so tests can read them without a refresh SELECT per object.
+
     :return: SQLAlchemy session connected to the test database
     :rtype: Session
     """
@@ -76,33 +149,53 @@ def db_session() -> Session:
 # --------------------------
 # Override get_db dependency for tests
 # --------------------------
-@pytest.fixture(autouse=True)
+def get_test_db() -> Generator[Session, None, None]:
+    """
+    Replacement for get_db that yields a session on the test database.
+
+    :yield: Session: A session bound to the in-memory test engine.
+    """
+
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True, scope="session")
 def override_get_db() -> None:
     """
     Overrides the FastAPI get_db dependency to use the test database.
 
-    Ensures that all routes use the in-memory database during tests.
+    Ensures that all routes use the in-memory database during tests. The
+    override is registered once for the whole session, since no test changes it.
 
     :return: None
     """
 
-    app.dependency_overrides[get_db] = lambda: TestingSessionLocal()
+    app.dependency_overrides[get_db] = get_test_db
     yield
     app.dependency_overrides.clear()
 
 # --------------------------
 # Fixture TestClient
 # --------------------------
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def test_client() -> TestClient:
     """
     Provides a FastAPI TestClient for making HTTP requests in tests.
 
-    :return: TestClient instance for the FastAPI app
-    :rtype: TestClient
+    One client is shared by the whole session: the app is the same for every
+    test and authentication uses bearer headers, not client-side cookies.
+    The client is entered once, so every request runs on the same event loop
+    thread instead of starting a new one per call.
+
+    :yield: TestClient instance for the FastAPI app
     """
 
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
 # --------------------------
@@ -134,7 +227,7 @@ def create_user(db_session: Session) -> Callable:
     :rtype: Callable
     """
 
-    def _create(email: str = None, password: str = "123456", verified: bool = True) -> User:
+    def _create(email: str = None, password: str = "123456", verified: bool = True, commit: bool = True) -> User:
         """"
         Factory to create a regular user in the test database.
 
@@ -147,15 +240,18 @@ def create_user(db_session: Session) -> Callable:
         :param verified: Indicates if the user is already verified.
         :type verified: bool
 
+        :param commit: Whether to commit immediately. Pass False when creating
+                       several objects in a row and let the last call commit.
+        :type commit: bool
+
         :return: The created User instance.
         :rtype: User
         """
 
         if email is None:
-            import uuid
-            email = f"user_{uuid.uuid4().hex}@test.com"
+            email = f"user_{next(_email_counter)}@test.com"
 
-        hashed_password = hash_password(password)
+        hashed_password = hashed(password)
 
         user = User(
             email=email,
@@ -166,8 +262,11 @@ def create_user(db_session: Session) -> Callable:
         )
 
         db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
+
+        if commit:
+            db_session.commit()
+        else:
+            db_session.flush()
 
         return user
 
@@ -189,7 +288,7 @@ def create_admin_user(db_session: Session) -> Callable:
     :rtype: Callable
     """
 
-    def _create(email: str = None, password: str = "123456") -> User:
+    def _create(email: str = None, password: str = "123456", commit: bool = True) -> User:
         """
         Factory to create an admin user in the test database.
 
@@ -199,15 +298,18 @@ def create_admin_user(db_session: Session) -> Callable:
         :param password: Admin password.
         :type password: str
 
+        :param commit: Whether to commit immediately. Pass False when creating
+                       several objects in a row and let the last call commit.
+        :type commit: bool
+
         :return: The created admin User instance.
         :rtype: User
         """
 
         if email is None:
-            import uuid
-            email = f"admin_{uuid.uuid4().hex}@test.com"
+            email = f"admin_{next(_email_counter)}@test.com"
 
-        hashed_password = hash_password(password)
+        hashed_password = hashed(password)
 
         admin = User(
             email=email,
@@ -218,8 +320,11 @@ def create_admin_user(db_session: Session) -> Callable:
         )
 
         db_session.add(admin)
-        db_session.commit()
-        db_session.refresh(admin)
+
+        if commit:
+            db_session.commit()
+        else:
+            db_session.flush()
 
         return admin
 
@@ -245,7 +350,8 @@ def create_product_in_db(db_session: Session) -> Callable:
         name: str = "Test Product",
         price: float = 10.0,
         description: str = "Default description",
-        stock: int = 0
+        stock: int = 0,
+        commit: bool = True
     ) -> Product:
         """
         Factory to create a product in the test database.
@@ -262,6 +368,10 @@ def create_product_in_db(db_session: Session) -> Callable:
         :param stock: Quantity in stock.
         :type stock: int
 
+        :param commit: Whether to commit immediately. Pass False when creating
+                       several objects in a row and let the last call commit.
+        :type commit: bool
+
         :return: The created Product instance.
         :rtype: Product
         """
@@ -274,14 +384,117 @@ def create_product_in_db(db_session: Session) -> Callable:
         )
 
         db_session.add(product)
-        db_session.commit()
-        db_session.refresh(product)
+
+        if commit:
+            db_session.commit()
+        else:
+            db_session.flush()
 
         return product
 
     return _create
 
 
+# --------------------------
+# Factory create_products_in_db
+# --------------------------
+@pytest.fixture()
+def create_products_in_db(db_session: Session) -> Callable:
+    """
+    Factory to seed several products at once in the test database.
+
+    :param db_session: Session database
+    :type db_session: Session
+
+    :return: Product seeding function
+    :rtype: Callable
+    """
+
+    def _create(*products: str | dict, price: float = 10.0, description: str = "Default description", stock: int = 0) -> None:
+        """
+        Inserts the given products with a single multi-row INSERT.
+
+        Each product is either a name, or a dict of columns for rows that
+        need their own values; missing columns take the shared defaults.
+        Rows are written without building ORM instances, so there is no
+        unit-of-work bookkeeping per product. Use create_product_in_db when
+        the test needs the Product objects back.
+
+        :param products: Product names or column dicts, in insertion order.
+        :type products: str | dict
+
+        :param price: Default price of every product.
+        :type price: float
+
+        :param description: Default description of every product.
+        :type description: str
+
+        :param stock: Default quantity in stock of every product.
+        :type stock: int
+
+        :return: None
+        """
+
+        defaults = {"price": price, "description": description, "stock": stock}
+
+        db_session.execute(
+            insert(Product),
+            [
+                {**defaults, **(product if isinstance(product, dict) else {"name": product})}
+                for product in products
+            ]
+        )
+        db_session.commit()
+
+    return _create
+
+
+# --------------------------
+# Factory create_refresh_token_in_db
+# --------------------------
+@pytest.fixture()
+def create_refresh_token_in_db(db_session: Session) -> Callable:
+    """
+    Factory to store refresh tokens in the test database.
+
+    :param db_session: Session database
+    :type db_session: Session
+
+    :return: Refresh token creation function
+    :rtype: Callable
+    """
+
+    def _create(user: User, plain_token: str, expires_in: timedelta) -> None:
+        """
+        Stores the hash of `plain_token` as a refresh token of `user`.
+
+        The row is written with a single Core INSERT; tests only need it to
+        exist for /auth/refresh, not a RefreshToken instance.
+
+        :param user: Owner of the refresh token.
+        :type user: User
+
+        :param plain_token: Plaintext token the test will send.
+        :type plain_token: str
+
+        :param expires_in: Time until expiry; negative for an already expired token.
+        :type expires_in: timedelta
+
+        :return: None
+        """
+
+        db_session.execute(
+            insert(RefreshToken).values(
+                user_id=user.id,
+                token_hash=hash_token(plain_token),
+                expires_at=datetime.now(timezone.utc) + expires_in
+            )
+        )
+        db_session.commit()
+
+    return _create
+
+
 # --------------------------
 # Fixture for login
 # --------------------------
@@ -319,3 +532,34 @@ def login_user(test_client: TestClient) -> Callable:
         return resp.json()
 
     return _login
+
+
+# --------------------------
+# Fixture for access tokens
+# --------------------------
+@pytest.fixture()
+def make_access_token() -> Callable:
+    """
+    Factory to mint access tokens without going through /auth/login.
+
+    Tests that only need an authenticated caller use it instead of a login
+    round-trip; the login flow itself is covered by the auth tests.
+
+    :return: Token minting function
+    :rtype: Callable
+    """
+
+    def _make(user: User) -> str:
+        """
+        Returns a signed access token for `user`, with the same claims login issues.
+
+        :param user: User the token is issued to.
+        :type user: User
+
+        :return: Encoded JWT access token.
+        :rtype: str
+        """
+
+        return create_access_token({"sub": str(user.id), "role": user.role})
+
+    return _make
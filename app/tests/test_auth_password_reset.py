@@ -9,6 +9,8 @@ This module tests the complete password reset workflow:
 1. Requesting a password reset (generates a token and sends email)
 2. Resetting the password using the token
 3. Logging in with the new password
+4. Ignoring repeated reset requests for the same email
+5. Rejecting a reset token that was already used
 
 The email sending is mocked to avoid sending real emails.
 """
@@ -110,3 +112,82 @@ def test_reset_password_flow(test_client: TestClient, create_user: Callable, mon
 
     assert login_resp.status_code == 200
     assert "access_token" in login_resp.json()
+
+
+def test_repeated_reset_requests_send_one_email(test_client: TestClient, create_user: Callable, monkeypatch: MonkeyPatch) -> None:
+    """
+    Tests that a burst of reset requests for one email sends a single email.
+
+    Steps:
+    1. Mock the reset email sender to count calls.
+    2. Request a password reset three times for the same email.
+    3. Assert every request succeeds with the generic message.
+    4. Assert only one email was sent.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_user: Factory to create a user in the test database.
+    :type create_user: Callable
+
+    :param monkeypatch: Pytest monkeypatch fixture to mock functions.
+    :type monkeypatch: MonkeyPatch
+    """
+
+    user = create_user(email="burst@test.com", verified=True)
+    sent = []
+
+    monkeypatch.setattr(
+        "app.services.email_service.EmailService.send_password_reset",
+        lambda to_email, token: sent.append(to_email) or True
+    )
+
+    for _ in range(3):
+        response = test_client.post("/auth/request-password-reset", json={"email": user.email})
+
+        assert response.status_code == 200
+        assert "reset link has been sent" in response.json()["detail"]
+
+    assert sent == [user.email]
+
+
+def test_reset_token_single_use(test_client: TestClient, create_user: Callable, monkeypatch: MonkeyPatch) -> None:
+    """
+    Tests that a reset token updates its own user's password and works only once.
+
+    Steps:
+    1. Create two users so user ids and reset token ids differ.
+    2. Request a password reset for the second user and capture the token.
+    3. Reset the password and log in with it.
+    4. Reuse the same token and assert it is rejected.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_user: Factory to create a user in the test database.
+    :type create_user: Callable
+
+    :param monkeypatch: Pytest monkeypatch fixture to mock functions.
+    :type monkeypatch: MonkeyPatch
+    """
+
+    create_user(email="bystander@test.com", verified=True)
+    user = create_user(email="single_use@test.com", verified=True)
+    captured = {}
+
+    monkeypatch.setattr(
+        "app.services.email_service.EmailService.send_password_reset",
+        lambda to_email, token: captured.update(token=token) or True
+    )
+
+    test_client.post("/auth/request-password-reset", json={"email": user.email})
+    payload = {"token": captured["token"], "new_password": "newpassword123"}
+
+    response = test_client.post("/auth/reset-password", json=payload)
+    assert response.status_code == 200
+
+    login_resp = test_client.post("/auth/login", json={"email": user.email, "password": "newpassword123"})
+    assert login_resp.status_code == 200
+
+    response = test_client.post("/auth/reset-password", json=payload)
+    assert response.status_code == 400
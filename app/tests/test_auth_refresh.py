@@ -9,11 +9,22 @@ This module contains tests for the refresh token functionality of the authentica
 Tests included:
 - test_refresh_token: Verify that a valid refresh token can be used
   to obtain new access and refresh tokens.
+- test_refresh_token_reuse_rejected: Verify that a rotated refresh token
+  cannot be used again.
+- test_refresh_lookup_racing_rotation_not_cached: Verify that a lookup that
+  read the token before a concurrent rotation does not cache it as active.
 """
 
+from _pytest.monkeypatch import MonkeyPatch
+from datetime import timedelta
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 from typing import Callable
 
+from app.core.tokens import hash_token
+from app.repositories import token_repository
+from app.repositories.token_repository import TokenRepository
+
 
 def test_refresh_token(test_client: TestClient, create_user: Callable, login_user: Callable) -> None:
     """
@@ -55,3 +66,84 @@ def test_refresh_token(test_client: TestClient, create_user: Callable, login_use
     # Step 5: verify response contains new access token
     data = response.json()
     assert "access_token" in data
+
+
+def test_refresh_token_reuse_rejected(test_client: TestClient, create_user: Callable, login_user: Callable) -> None:
+    """
+    Test that a refresh token stops working once it has been rotated.
+
+    Steps:
+    1. Create a verified user and log in to obtain a refresh token.
+    2. Use the refresh token once.
+    3. Use the same refresh token again.
+    4. Assert the second attempt is rejected with 401.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_user: Factory to create a user in the test database.
+    :type create_user: Callable
+
+    :param login_user: Helper to log in a user and return tokens.
+    :type login_user: Callable
+
+    :return: None
+    """
+
+    user = create_user(email="refresh_reuse@test.com", verified=True)
+    refresh_token = login_user(user.email, "123456").get("refresh_token")
+
+    first = test_client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert first.status_code == 200
+
+    second = test_client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert second.status_code == 401
+
+
+def test_refresh_lookup_racing_rotation_not_cached(
+    db_session: Session,
+    create_user: Callable,
+    create_refresh_token_in_db: Callable,
+    monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test that a token lookup overlapping a rotation does not cache the pre-rotation row.
+
+    Steps:
+    1. Create a verified user and a refresh token for them.
+    2. Look the token up, rotating it right after the row is read but before
+       the lookup fills the cache.
+    3. Verify that the next lookup sees the token as revoked.
+
+    :param db_session: SQLAlchemy session connected to the test database.
+    :type db_session: Session
+
+    :param create_user: Factory fixture to create a test user
+    :type create_user: Callable
+
+    :param create_refresh_token_in_db: Factory function to store a refresh token in the test database.
+    :type create_refresh_token_in_db: Callable
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: MonkeyPatch
+
+    :return: None
+    """
+
+    user = create_user(email="race@test.com", verified=True)
+    create_refresh_token_in_db(user, "racetoken123", timedelta(minutes=5))
+
+    original_record = token_repository.RefreshTokenRecord
+
+    def record_then_rotate(*row):
+        record = original_record(*row)
+        monkeypatch.setattr(token_repository, "RefreshTokenRecord", original_record)
+        assert TokenRepository.rotate(db_session, record, hash_token("racetoken456"), record.expires_at)
+        return record
+
+    monkeypatch.setattr(token_repository, "RefreshTokenRecord", record_then_rotate)
+
+    # The racing lookup still returns what it read before the rotation
+    assert TokenRepository.get_by_plain(db_session, "racetoken123").revoked is False
+
+    assert TokenRepository.get_by_plain(db_session, "racetoken123").revoked is True
@@ -6,11 +6,18 @@ User Registration Tests
 
 This module tests the user registration endpoint of the authentication API.
 
-Test included:
+Tests included:
 - test_register_user: Ensure a new user can register successfully and receives the expected response.
+- test_register_bootstrap_roles: Ensure the first users receive the superadmin and admin roles.
+
+Only test_register_user goes through the HTTP route; role assignment is
+business logic and is checked against AuthService directly.
 """
 
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.services.auth_service import AuthService
 
 
 def test_register_user(test_client: TestClient):
@@ -32,3 +39,23 @@ def test_register_user(test_client: TestClient):
     data = response.json()
     assert data["email"] == "new@test.com"
     assert "id" in data
+
+
+def test_register_bootstrap_roles(db_session: Session):
+    """
+    Test role assignment for the first registered users.
+
+    Steps:
+    1. Register three users in sequence through AuthService.
+    2. Assert the first is a superadmin, the second an admin and the third a user.
+
+    :param db_session: SQLAlchemy session for test database.
+    :type db_session: Session
+    """
+
+    roles = [
+        AuthService.register(db_session, f"boot{i}@test.com", "123456", None).role
+        for i in range(3)
+    ]
+
+    assert roles == ["superadmin", "admin", "user"]
@@ -13,23 +13,21 @@ Tests included:
 from fastapi.testclient import TestClient
 
 
-def test_admin_rout_forbidden(test_client: TestClient, create_user):
+def test_admin_rout_forbidden(test_client: TestClient, create_user, make_access_token):
     """
     Test that a non-admin user is forbidden from accessing admin routes.
 
     Steps:
     1. Create a regular user using the `create_user` fixture.
-    2. Log in to obtain an access token.
+    2. Mint an access token for it.
     3. Attempt to access the admin dashboard with the user's token.
     4. Assert that the response status code is 403 (Forbidden).
 
     :param test_client: TestClient fixture for API requests.
     """
 
-    create_user("user@test.com")
-    login = test_client.post("/auth/login", json={"email": "user@test.com", "password": "123456"})
-
-    token = login.json()["access_token"]
+    user = create_user("user@test.com")
+    token = make_access_token(user)
 
     response = test_client.get(
         "/admin/users/dashboard",
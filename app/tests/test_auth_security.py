@@ -8,9 +8,15 @@ This module tests security-related scenarios for authentication endpoints.
 
 Tests included:
 - test_access_token_invalid: Ensure that an invalid JWT access token is rejected.
+- test_login_blocked_after_repeated_failures: Ensure brute-force protection blocks further logins.
+- test_cached_access_token_rejected_for_deleted_user: Ensure a cached token verification still requires the user.
 """
 
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from typing import Callable
+
+from app.core.security import access_token_cache
 
 
 def test_access_token_invalid(test_client: TestClient):
@@ -31,3 +37,75 @@ def test_access_token_invalid(test_client: TestClient):
         headers={"Authorization": f"Bearer {bad_token}"}
     )
     assert response.status_code == 401
+
+
+def test_login_blocked_after_repeated_failures(test_client: TestClient, create_user: Callable) -> None:
+    """
+    Test that repeated failed logins trigger brute-force protection.
+
+    Steps:
+    1. Create a verified user.
+    2. Send five logins with a wrong password and assert each returns 401.
+    3. Send a login with the correct password.
+    4. Assert that the response status code is 429 Too Many Requests.
+
+    :param test_client: TestClient fixture for API requests.
+    :type test_client: TestClient
+
+    :param create_user: Factory fixture to create a test user.
+    :type create_user: Callable
+
+    :return: None
+    """
+
+    user = create_user(email="bruteforce@test.com", verified=True)
+
+    for _ in range(5):
+        response = test_client.post("/auth/login", json={"email": user.email, "password": "wrong"})
+        assert response.status_code == 401
+
+    response = test_client.post("/auth/login", json={"email": user.email, "password": "123456"})
+    assert response.status_code == 429
+
+
+def test_cached_access_token_rejected_for_deleted_user(
+    test_client: TestClient,
+    db_session: Session,
+    create_user: Callable,
+    make_access_token: Callable
+) -> None:
+    """
+    Test that a token whose verification is cached stops working once its user is gone.
+
+    Steps:
+    1. Create a user and call '/auth/me' with its token, caching the verification.
+    2. Delete the user.
+    3. Call '/auth/me' again with the same token.
+    4. Assert that the response status code is 401 Unauthorized.
+
+    :param test_client: TestClient fixture for API requests.
+    :type test_client: TestClient
+
+    :param db_session: SQLAlchemy session for test database.
+    :type db_session: Session
+
+    :param create_user: Factory fixture to create a test user.
+    :type create_user: Callable
+
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
+
+    :return: None
+    """
+
+    user = create_user(email="cached_token@test.com", verified=True)
+    headers = {"Authorization": f"Bearer {make_access_token(user)}"}
+
+    assert test_client.get("/auth/me", headers=headers).status_code == 200
+    assert access_token_cache.get(headers["Authorization"].split()[1]) is not None
+
+    db_session.delete(user)
+    db_session.commit()
+
+    response = test_client.get("/auth/me", headers=headers)
+    assert response.status_code == 401
@@ -10,7 +10,8 @@ including role-based access checks (admin/user) and integration with the databas
 Models tested:
 - Product (can be extended to other models)
 
-The test performs the full CRUD cycle:
+Each CRUD operation is a separate test, parametrized over the models, so a
+failure points at the operation that broke:
 1. CREATE
 2. READ (list)
 3. UPDATE
@@ -23,7 +24,7 @@ Additionally, it verifies role-based restrictions:
 
 import pytest
 from fastapi.testclient import TestClient
-from typing import Callable
+from typing import Callable, Dict
 
 
 # --------------------------
@@ -44,33 +45,14 @@ MODELS_TO_TEST = [
     # Additional models can be added here with the same structure
 ]
 
-@pytest.mark.parametrize("item", MODELS_TO_TEST)
-def test_auto_crud(
-    test_client: TestClient,
-    create_admin_user: Callable,
-    create_user: Callable,
-    login_user: Callable,
-    item: dict
-) -> None:
-    """
-    Automatic CRUD + Role-Based Access Test.
 
-    This test dynamically checks CRUD operations for the specified model,
-    verifying that admin users can fully manage the resource and regular users
-    are restricted for admin-only models.
-
-    Steps:
-    1. Create admin and regular user accounts.
-    2. Login as both users and obtain access tokens.
-    3. Admin performs CREATE operation successfully.
-    4. If admin_only=True, regular user CREATE should fail.
-    5. Admin performs READ operation to list items.
-    6. Admin performs UPDATE operation on the created item.
-    7. Admin performs DELETE operation on the created item.
-    8. Verify that the item is removed from the list after deletion.
-
-    :param test_client: FastAPI TestClient instance for making API requests.
-    :type test_client: TestClient
+# --------------------------
+# Shared fixtures
+# --------------------------
+@pytest.fixture()
+def auth_headers(create_admin_user: Callable, create_user: Callable, make_access_token: Callable) -> Dict[str, dict]:
+    """
+    Creates an admin and a regular user and returns their Authorization headers.
 
     :param create_admin_user: Factory function to create an admin user.
     :type create_admin_user: Callable
@@ -78,68 +60,180 @@ def test_auto_crud(
     :param create_user: Factory function to create a regular user.
     :type create_user: Callable
 
-    :param login_user: Factory function to perform user login and return tokens.
-    :type login_user: Callable
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
+
+    :return: Headers keyed by "admin" and "user".
+    :rtype: Dict[str, dict]
+    """
+
+    admin = create_admin_user(commit=False)
+    user = create_user()
+
+    return {
+        "admin": {"Authorization": f"Bearer {make_access_token(admin)}"},
+        "user": {"Authorization": f"Bearer {make_access_token(user)}"}
+    }
+
+
+def create_item(test_client: TestClient, item: dict, headers: dict) -> dict:
+    """
+    Creates one item of the model through its route and returns the response body.
+
+    :param test_client: FastAPI TestClient instance for making API requests.
+    :type test_client: TestClient
 
     :param item: Dictionary defining model to test, route, payload, and admin-only flag.
     :type item: dict
 
-    :return: None
+    :param headers: Authorization headers of an admin user.
+    :type headers: dict
+
+    :return: The created item.
+    :rtype: dict
     """
 
-    # --------------------------
-    # Create admin and regular user
-    # --------------------------
-    admin = create_admin_user()
-    user = create_user()
+    response = test_client.post(item["route"] + "/", json=item["create_payload"](), headers=headers)
+    assert response.status_code == 201
 
-    admin_token = login_user(admin.email, "123456")["access_token"]
-    user_token = login_user(user.email, "123456")["access_token"]
+    return response.json()
 
-    headers_admin = {"Authorization": f"Bearer {admin_token}"}
-    headers_user = {"Authorization": f"Bearer {user_token}"}
 
-    # --------------------------
-    # CREATE
-    # --------------------------
-    create_payload = item["create_payload"]()
-    response = test_client.post(item["route"] + "/", json=create_payload, headers=headers_admin)
-    assert response.status_code == 201
-    created_item = response.json()
+# --------------------------
+# CREATE
+# --------------------------
+@pytest.mark.parametrize("item", MODELS_TO_TEST)
+def test_auto_crud_create(test_client: TestClient, auth_headers: Dict[str, dict], item: dict) -> None:
+    """
+    Test that an admin can create the item and, for admin-only models, a regular user cannot.
+
+    Steps:
+    1. Admin performs CREATE operation successfully.
+    2. If admin_only=True, regular user CREATE should fail.
+
+    :param test_client: FastAPI TestClient instance for making API requests.
+    :type test_client: TestClient
+
+    :param auth_headers: Authorization headers of an admin and a regular user.
+    :type auth_headers: Dict[str, dict]
+
+    :param item: Dictionary defining model to test, route, payload, and admin-only flag.
+    :type item: dict
+
+    :return: None
+    """
+
+    created_item = create_item(test_client, item, auth_headers["admin"])
+    assert created_item["name"] == item["create_payload"]()["name"]
 
     # Admin-only check for regular user
     if item.get("admin_only", False):
-        response_user = test_client.post(item["route"] + "/", json=create_payload, headers=headers_user)
+        response_user = test_client.post(item["route"] + "/", json=item["create_payload"](), headers=auth_headers["user"])
         assert response_user.status_code in [403, 401]
 
-    # --------------------------
-    # READ (LIST)
-    # --------------------------
-    response = test_client.get(item["route"] + "/", headers=headers_admin)
+
+# --------------------------
+# READ (LIST)
+# --------------------------
+@pytest.mark.parametrize("item", MODELS_TO_TEST)
+def test_auto_crud_list(test_client: TestClient, auth_headers: Dict[str, dict], item: dict) -> None:
+    """
+    Test that a created item appears in the list.
+
+    Steps:
+    1. Admin creates an item.
+    2. Admin performs READ operation to list items.
+    3. Assert the created item is listed.
+
+    :param test_client: FastAPI TestClient instance for making API requests.
+    :type test_client: TestClient
+
+    :param auth_headers: Authorization headers of an admin and a regular user.
+    :type auth_headers: Dict[str, dict]
+
+    :param item: Dictionary defining model to test, route, payload, and admin-only flag.
+    :type item: dict
+
+    :return: None
+    """
+
+    created_item = create_item(test_client, item, auth_headers["admin"])
+
+    response = test_client.get(item["route"] + "/", headers=auth_headers["admin"])
     assert response.status_code == 200
-    assert any(d["name"] == create_payload["name"] for d in response.json())
+    assert any(d["id"] == created_item["id"] for d in response.json())
+
+
+# --------------------------
+# UPDATE
+# --------------------------
+@pytest.mark.parametrize("item", MODELS_TO_TEST)
+def test_auto_crud_update(test_client: TestClient, auth_headers: Dict[str, dict], item: dict) -> None:
+    """
+    Test that an admin can update a created item.
+
+    Steps:
+    1. Admin creates an item.
+    2. Admin performs UPDATE operation on the created item.
+    3. Assert the response holds the updated value.
+
+    :param test_client: FastAPI TestClient instance for making API requests.
+    :type test_client: TestClient
+
+    :param auth_headers: Authorization headers of an admin and a regular user.
+    :type auth_headers: Dict[str, dict]
+
+    :param item: Dictionary defining model to test, route, payload, and admin-only flag.
+    :type item: dict
+
+    :return: None
+    """
+
+    created_item = create_item(test_client, item, auth_headers["admin"])
 
-    # --------------------------
-    # UPDATE
-    # --------------------------
     update_payload = {"name": "Updated AutoTest"}
     response = test_client.put(
         f"{item['route']}/{created_item['id']}",
         json=update_payload,
-        headers=headers_admin
+        headers=auth_headers["admin"]
     )
     assert response.status_code == 200
     assert response.json()["name"] == "Updated AutoTest"
 
-    # --------------------------
-    # DELETE
-    # --------------------------
+
+# --------------------------
+# DELETE
+# --------------------------
+@pytest.mark.parametrize("item", MODELS_TO_TEST)
+def test_auto_crud_delete(test_client: TestClient, auth_headers: Dict[str, dict], item: dict) -> None:
+    """
+    Test that an admin can delete a created item.
+
+    Steps:
+    1. Admin creates an item.
+    2. Admin performs DELETE operation on the created item.
+    3. Verify that the item is removed from the list after deletion.
+
+    :param test_client: FastAPI TestClient instance for making API requests.
+    :type test_client: TestClient
+
+    :param auth_headers: Authorization headers of an admin and a regular user.
+    :type auth_headers: Dict[str, dict]
+
+    :param item: Dictionary defining model to test, route, payload, and admin-only flag.
+    :type item: dict
+
+    :return: None
+    """
+
+    created_item = create_item(test_client, item, auth_headers["admin"])
+
     response = test_client.delete(
         f"{item['route']}/{created_item['id']}",
-        headers=headers_admin
+        headers=auth_headers["admin"]
     )
     assert response.status_code == 200
 
     # Verify deletion
-    response = test_client.get(item["route"] + "/", headers=headers_admin)
+    response = test_client.get(item["route"] + "/", headers=auth_headers["admin"])
     assert all(d["id"] != created_item["id"] for d in response.json())
@@ -8,12 +8,17 @@ This module tests the EmailService class, ensuring that:
 
 1. Verification emails are sent correctly.
 2. Password reset emails are sent correctly.
+3. The shared HTTP client keeps working across application restarts.
 
 All actual email sending is mocked to avoid sending real emails.
 """
 
+import httpx
 from fastapi.testclient import TestClient
 
+from app.main import app
+from app.services import email_client
+from app.services.email_client import EmailClient
 from app.services.email_service import EmailService
 
 
@@ -138,3 +143,37 @@ def test_send_password_reset_email(test_client: TestClient, create_user, monkeyp
     # ---------------------------
     assert called["to_email"] == user.email
     assert isinstance(called["token"], str) and len(called["token"]) > 0
+
+
+def test_send_email_after_lifespan_restart(monkeypatch) -> None:
+    """
+    Test that emails can still be sent after the application lifespan has shut
+    down and started again, which closes the shared HTTP client.
+
+    Brevo is replaced by an httpx mock transport that records every request.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: Pytest fixture.
+
+    :return: None
+    """
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(201)
+
+    def build_mock_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=email_client.BREVO_API_URL, transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(email_client, "_build_client", build_mock_client)
+    monkeypatch.setattr(email_client, "_client", build_mock_client())
+
+    # Each run's shutdown closes the client; the next send must reopen it
+    for run in range(2):
+        with TestClient(app) as client:
+            assert client.portal.call(EmailClient.send_email, "user@example.com", "Subject", "<p>Hi</p>") is True
+
+        assert email_client._client.is_closed
+        assert len(sent) == run + 1
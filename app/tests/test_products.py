@@ -6,20 +6,23 @@ Products API Tests
 
 This module tests all CRUD operations for the products API, including:
 
-1. Listing products
-2. Creating products (authorized and unauthorized)
-3. Updating products
-4. Deleting products
-5. Handling non-existent products
+1. Listing products (with and without name search, keyset and paginated)
+2. Retrieving a single product (cached until the next write)
+3. Creating products (authorized and unauthorized)
+4. Updating and deleting products, including non-existent ones
 
 All tests use the FastAPI TestClient and database fixtures.
 """
 
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from fastapi.testclient import TestClient
 from typing import Callable
 
+from app.schemas import ProductOut
 
-def test_list_products(test_client: TestClient, create_product_in_db: Callable) -> None:
+
+def test_list_products(test_client: TestClient, create_products_in_db: Callable) -> None:
     """
     Test retrieving a list of products.
 
@@ -32,13 +35,16 @@ def test_list_products(test_client: TestClient, create_product_in_db: Callable)
     :param test_client: FastAPI TestClient instance.
     :type test_client: TestClient
 
-    :param create_product_in_db: Factory function to create a product in the database.
-    :type create_product_in_db: Callable
+    :param create_products_in_db: Factory function to seed several products in the database.
+    :type create_products_in_db: Callable
 
     :return: None
     """
-    create_product_in_db(name="Prod 1", description="Desc 1", price=20.0, stock=5)
-    create_product_in_db(name="Prod 2", description="Desc 2", price=30.0, stock=5)
+    create_products_in_db(
+        {"name": "Prod 1", "description": "Desc 1", "price": 20.0},
+        {"name": "Prod 2", "description": "Desc 2", "price": 30.0},
+        stock=5
+    )
 
     response = test_client.get("/products/")
     assert response.status_code == 200
@@ -46,13 +52,203 @@ def test_list_products(test_client: TestClient, create_product_in_db: Callable)
     assert len(data) >= 2
 
 
-def test_create_product_authorized(test_client: TestClient, create_admin_user: Callable) -> None:
+def test_list_products_search(test_client: TestClient, create_products_in_db: Callable) -> None:
+    """
+    Test filtering the product list by name.
+
+    Steps:
+    1. Create two products with different names.
+    2. Call the /products/ endpoint with a search term matching only one of them.
+    3. Assert the response status code is 200.
+    4. Assert that only the matching product is returned.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_products_in_db: Factory function to seed several products in the database.
+    :type create_products_in_db: Callable
+
+    :return: None
+    """
+
+    create_products_in_db("Blue Keyboard", "Red Mouse")
+
+    response = test_client.get("/products/", params={"q": "keyboard"})
+    assert response.status_code == 200
+
+    names = [item["name"] for item in response.json()]
+    assert names == ["Blue Keyboard"]
+
+
+def test_list_products_after_id(test_client: TestClient, create_products_in_db: Callable) -> None:
+    """
+    Test keyset pagination of the product list.
+
+    Steps:
+    1. Create three products in the test database.
+    2. Request the first page with a page size of two.
+    3. Request the next page using the last id received as `after_id`.
+    4. Assert the second page holds only the remaining product.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_products_in_db: Factory function to seed several products in the database.
+    :type create_products_in_db: Callable
+
+    :return: None
+    """
+
+    create_products_in_db("Prod A", "Prod B", "Prod C")
+
+    first_page = test_client.get("/products/", params={"limit": 2}).json()
+    assert [item["name"] for item in first_page] == ["Prod A", "Prod B"]
+
+    response = test_client.get("/products/", params={"limit": 2, "after_id": first_page[-1]["id"]})
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Prod C"]
+
+
+def test_list_products_paginated(test_client: TestClient, create_products_in_db: Callable) -> None:
+    """
+    Test the paginated product list envelope.
+
+    Steps:
+    1. Create three products in the test database.
+    2. Request the second page with a page size of two.
+    3. Assert the total counts every product.
+    4. Assert the page holds only the remaining product.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_products_in_db: Factory function to seed several products in the database.
+    :type create_products_in_db: Callable
+
+    :return: None
+    """
+
+    create_products_in_db("Prod A", "Prod B", "Prod C")
+
+    response = test_client.get("/products/paginated", params={"page": 2, "limit": 2})
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["total"] == 3
+    assert data["page"] == 2
+    assert [item["name"] for item in data["result"]] == ["Prod C"]
+
+
+def test_get_product_cache_cleared_on_update(test_client: TestClient, create_admin_user: Callable, create_product_in_db: Callable, make_access_token: Callable) -> None:
+    """
+    Test that a cached product detail is refreshed after an update.
+
+    Steps:
+    1. Create a product and fetch it, populating the cache.
+    2. Update its name as an admin.
+    3. Fetch it again.
+    4. Assert the updated name is returned, not the cached one.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_admin_user: Factory function to create an admin user.
+    :type create_admin_user: Callable
+
+    :param create_product_in_db: Factory function to create a product in the database.
+    :type create_product_in_db: Callable
+
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
+
+    :return: None
+    """
+
+    product = create_product_in_db(name="Old Name")
+
+    response = test_client.get(f"/products/{product.id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Old Name"
+
+    admin = create_admin_user(email="admin_cache@test.com")
+    access_token = make_access_token(admin)
+
+    test_client.put(
+        f"/products/{product.id}",
+        json={"name": "New Name"},
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    response = test_client.get(f"/products/{product.id}")
+    assert response.json()["name"] == "New Name"
+
+
+def test_get_product_fill_dropped_after_concurrent_update(
+    test_client: TestClient,
+    create_admin_user: Callable,
+    create_product_in_db: Callable,
+    make_access_token: Callable,
+    monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test that a cache miss does not cache data loaded before a concurrent update.
+
+    Steps:
+    1. Create a product; nothing is cached yet.
+    2. Fetch it, and while the request has loaded the row but not yet filled
+       the cache, update the product's name as an admin.
+    3. Fetch it again.
+    4. Assert the updated name is returned, not the one loaded before the update.
+
+    :param test_client: FastAPI TestClient instance.
+    :type test_client: TestClient
+
+    :param create_admin_user: Factory function to create an admin user.
+    :type create_admin_user: Callable
+
+    :param create_product_in_db: Factory function to create a product in the database.
+    :type create_product_in_db: Callable
+
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
+
+    :param monkeypatch: Pytest monkeypatch fixture to hook serialization.
+    :type monkeypatch: MonkeyPatch
+
+    :return: None
+    """
+
+    product = create_product_in_db(name="Old Name")
+    headers = {"Authorization": f"Bearer {make_access_token(create_admin_user())}"}
+    validate = ProductOut.model_validate
+
+    def validate_then_update(obj, *args, **kwargs):
+        # Serialize the row as loaded, then let the update commit and clear
+        # the cache before the reader gets to fill it
+        out = validate(obj, *args, **kwargs)
+        monkeypatch.setattr(ProductOut, "model_validate", validate)
+
+        response = test_client.put(f"/products/{product.id}", json={"name": "New Name"}, headers=headers)
+        assert response.status_code == 200
+
+        return out
+
+    monkeypatch.setattr(ProductOut, "model_validate", staticmethod(validate_then_update))
+
+    response = test_client.get(f"/products/{product.id}")
+    assert response.json()["name"] == "Old Name"
+
+    response = test_client.get(f"/products/{product.id}")
+    assert response.json()["name"] == "New Name"
+
+
+def test_create_product_authorized(test_client: TestClient, create_admin_user: Callable, make_access_token: Callable) -> None:
     """
     Test that an admin user can create a product.
 
     Steps:
     1. Create an admin user.
-    2. Log in to obtain an access token.
+    2. Mint an access token for it.
     3. Send a POST request to /products/ with product data.
     4. Assert the response status code is 201.
     5. Assert the product data that matches the send as payload.
@@ -63,14 +259,14 @@ def test_create_product_authorized(test_client: TestClient, create_admin_user: C
     :param create_admin_user: Factory function to create an admin user.
     :type create_admin_user: Callable
 
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
+
     :return: None
     """
 
     user = create_admin_user()
-
-    # Login to get access token
-    login = test_client.post("/auth/login", json={"email": user.email, "password": "123456"})
-    token = login.json()["access_token"]
+    token = make_access_token(user)
 
     payload = {
         "name": "New Product",
@@ -88,13 +284,13 @@ def test_create_product_authorized(test_client: TestClient, create_admin_user: C
     assert data["name"] == payload["name"]
 
 
-def test_create_product_unauthorized(test_client: TestClient, create_user: Callable, login_user: Callable) -> None:
+def test_create_product_unauthorized(test_client: TestClient, create_user: Callable, make_access_token: Callable) -> None:
     """
     Test that a non-admin user cannot create a product.
 
     Steps:
     1. Create a regular user.
-    2. Log in to obtain an access token.
+    2. Mint an access token for it.
     3. Attempt to POST a new product with this user's token.
     4. Assert the response status code is 403 (Forbidden).
 
@@ -104,17 +300,14 @@ def test_create_product_unauthorized(test_client: TestClient, create_user: Calla
     :param create_user: Factory function to create a regular user.
     :type create_user: Callable
 
-    :param login_user: Factory function to log in a user and get tokens.
-    :type login_user: Callable
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
 
     :return: None
     """
 
     user = create_user(email="regular_user@test.com", verified=True)
-    tokens = login_user(user.email, "123456")
-    access_token = tokens.get("access_token")
-
-    assert access_token is not None
+    access_token = make_access_token(user)
 
     response = test_client.post(
         "/products/",
@@ -125,12 +318,12 @@ def test_create_product_unauthorized(test_client: TestClient, create_user: Calla
     assert response.status_code == 403
 
 
-def test_update_product(test_client: TestClient, create_admin_user: Callable, create_product_in_db: Callable, login_user: Callable) -> None:
+def test_update_product(test_client: TestClient, create_admin_user: Callable, create_product_in_db: Callable, make_access_token: Callable) -> None:
     """
     Test updating an existing product.
 
     Steps:
-    1. Create an admin user and log in to obtain a token.
+    1. Create an admin user and mint an access token for it.
     2. Create a product in the database.
     3. Send a PUT request to update the product's name.
     4. Assert the response status code is 200.
@@ -145,36 +338,31 @@ def test_update_product(test_client: TestClient, create_admin_user: Callable, cr
     :param create_product_in_db: Factory function to create a product in the database.
     :type create_product_in_db: Callable
 
-    :param login_user: Factory function to log in a user and get tokens.
-    :type login_user: Callable
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
 
     :return: None
     """
 
-    admin = create_admin_user(email="admin_update@test.com")
-    tokens = login_user(admin.email, "123456")
-    access_token = tokens.get("access_token")
-
-    assert access_token is not None
+    admin = create_admin_user()
+    access_token = make_access_token(admin)
 
     product = create_product_in_db()
-
     response = test_client.put(
         f"/products/{product.id}",
         json={"name": "Updated Name"},
         headers={"Authorization": f"Bearer {access_token}"}
     )
-
     assert response.status_code == 200
     assert response.json()["name"] == "Updated Name"
 
 
-def test_delete_product(test_client: TestClient, create_admin_user: Callable, create_product_in_db: Callable, login_user: Callable) -> None:
+def test_delete_product(test_client: TestClient, create_admin_user: Callable, create_product_in_db: Callable, make_access_token: Callable) -> None:
     """
     Test deleting a product.
 
     Steps:
-    1. Create an admin user and log in to obtain a token.
+    1. Create an admin user and mint an access token for it.
     2. Create a product in the database.
     3. Send a DELETE request to remove the product.
     4. Assert the response status code is 200.
@@ -188,17 +376,14 @@ def test_delete_product(test_client: TestClient, create_admin_user: Callable, cr
     :param create_product_in_db: Factory function to create a product in the database.
     :type create_product_in_db: Callable
 
-    :param login_user: Factory function to log in a user and get tokens.
-    :type login_user: Callable
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
 
     :return: None
     """
 
-    admin = create_admin_user(email="admin_delete@test.com")
-    tokens = login_user(admin.email, "123456")
-    access_token = tokens.get("access_token")
-
-    assert access_token is not None
+    admin = create_admin_user()
+    access_token = make_access_token(admin)
 
     product = create_product_in_db()
 
@@ -210,13 +395,23 @@ def test_delete_product(test_client: TestClient, create_admin_user: Callable, cr
     assert response.status_code == 200
 
 
-def test_update_nonexistent_product(test_client: TestClient, create_admin_user: Callable, login_user: Callable) -> None:
+@pytest.mark.parametrize("method, payload", [
+    pytest.param("PUT", {"name": "Doesn't matter"}, id="update"),
+    pytest.param("DELETE", None, id="delete"),
+])
+def test_write_nonexistent_product(
+    test_client: TestClient,
+    create_admin_user: Callable,
+    make_access_token: Callable,
+    method: str,
+    payload: dict | None
+) -> None:
     """
-    Test updating a non-existent product.
+    Test updating or deleting a non-existent product.
 
     Steps:
-    1. Create an admin user and log in to obtain a token.
-    2. Send a PUT request to update a product ID that doesn't exist.
+    1. Create an admin user and mint an access token for it.
+    2. Send the PUT or DELETE request for a product ID that doesn't exist.
     3. Assert the response status code is 404.
 
     :param test_client: FastAPI TestClient instance.
@@ -225,55 +420,25 @@ def test_update_nonexistent_product(test_client: TestClient, create_admin_user:
     :param create_admin_user: Factory function to create an admin user.
     :type create_admin_user: Callable
 
-    :param login_user: Factory function to log in a user and get tokens.
-    :type login_user: Callable
-
-    :return: None
-    """
-
-    admin = create_admin_user(email="admin_nonexist@test.com")
-    tokens = login_user(admin.email, "123456")
-    access_token = tokens.get("access_token")
-
-    assert access_token is not None
-
-    response = test_client.put(
-        "/products/9999",
-        json={"name": "Doesn't matter"},
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-
-    assert response.status_code == 404
+    :param make_access_token: Factory function to mint an access token for a user.
+    :type make_access_token: Callable
 
+    :param method: HTTP method of the write.
+    :type method: str
 
-def test_delete_nonexistent_product(test_client: TestClient, create_admin_user: Callable, login_user: Callable) -> None:
-    """
-    Test deleting a non-existent product.
-
-    Steps:
-    1. Create an admin user and log in to obtain a token.
-    2. Send a DELETE request for a product ID that doesn't exist.
-    3. Assert the response status code is 404.
-
-    :param test_client: FastAPI TestClient instance.
-    :type test_client: TestClient
-
-    :param create_admin_user: Factory function to create an admin user.
-    :type create_admin_user: Callable
-
-    :param login_user: Factory function to log in a user and get tokens.
-    :type login_user: Callable
+    :param payload: JSON body of the request, if any.
+    :type payload: dict | None
 
     :return: None
     """
 
-    admin = create_admin_user(email="admin_nonexist_delete@test.com")
-    tokens = login_user(admin.email, "123456")
-    access_token = tokens.get("access_token")
-    assert access_token is not None
+    admin = create_admin_user()
+    access_token = make_access_token(admin)
 
-    response = test_client.delete(
+    response = test_client.request(
+        method,
         "/products/9999",
+        json=payload,
         headers={"Authorization": f"Bearer {access_token}"}
     )
     assert response.status_code == 404
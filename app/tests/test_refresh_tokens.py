@@ -13,16 +13,12 @@ Tests include:
 All tests use manually created refresh tokens in the test database.
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from fastapi.testclient import TestClient
 from typing import Callable
 
-from app.repositories import TokenRepository
-from app.core.tokens import hash_token
-from app.tests.conftest import TestingSessionLocal, create_user
 
-
-def test_refresh_token_valid(test_client: TestClient, create_user: Callable) -> None:
+def test_refresh_token_valid(test_client: TestClient, create_user: Callable, create_refresh_token_in_db: Callable) -> None:
     """
     Test refreshing an access token using a valid refresh token.
 
@@ -39,17 +35,16 @@ def test_refresh_token_valid(test_client: TestClient, create_user: Callable) ->
     :param create_user: Factory function to create a user in the test database.
     :type create_user: Callable
 
+    :param create_refresh_token_in_db: Factory function to store a refresh token in the test database.
+    :type create_refresh_token_in_db: Callable
+
     :return: None
     """
 
-    db = TestingSessionLocal()
     user = create_user(email="valid@test.com", verified=True)
 
     plain_token = "validtoken123"
-    hashed_token = hash_token(plain_token)
-    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
-
-    TokenRepository.create_refresh(db, user.id, hashed_token, expires_at)
+    create_refresh_token_in_db(user, plain_token, timedelta(minutes=5))
 
     # Tries to use the valid token
     response = test_client.post("/auth/refresh", json={"refresh_token": plain_token})
@@ -62,10 +57,8 @@ def test_refresh_token_valid(test_client: TestClient, create_user: Callable) ->
     assert "refresh_token" in data
     assert data["token_type"] == "Bearer"
 
-    db.close()
-
 
-def test_refresh_token_expired(test_client: TestClient, create_user: Callable) -> None:
+def test_refresh_token_expired(test_client: TestClient, create_user: Callable, create_refresh_token_in_db: Callable) -> None:
     """
     Test that using an expired refresh token returns a 401 Unauthorized error.
 
@@ -82,24 +75,20 @@ def test_refresh_token_expired(test_client: TestClient, create_user: Callable) -
     :param create_user: Factory function to create a user in the test database.
     :type create_user: Callable
 
+    :param create_refresh_token_in_db: Factory function to store a refresh token in the test database.
+    :type create_refresh_token_in_db: Callable
+
     :return: None
     """
 
-    db = TestingSessionLocal()
-
     user = create_user(email="expired@test.com", verified=True)
 
     # Create refresh expired refresh token
     plain_token = "expiredtoken123"
-    hashed_token = hash_token(plain_token)
-    expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)  # Already expired
-
-    TokenRepository.create_refresh(db, user.id, hashed_token, expires_at)
+    create_refresh_token_in_db(user, plain_token, timedelta(minutes=-1))  # Already expired
 
     # Tries to use the expired token
     response = test_client.post("/auth/refresh", json={"refresh_token": plain_token})
 
     assert response.status_code == 401
     assert "Invalid or expired refresh token" in response.json()["detail"]
-
-    db.close()